@@ -24,8 +24,8 @@ class TC_SRX_001(cmbird, BaseTest):
         """
         # 使用 BaseTest 已初始化的浏览器与页面
         self.logger.info("准备阶段：初始化测试页面")
-        self.login_page = LoginPage(self.page)
-        self.dashboard_page = DashboardPage(self.page)
+        self.login_page = self.get_page_object(LoginPage)
+        self.dashboard_page = self.get_page_object(DashboardPage)
     
     # 测试用例的主要业务流程
     def process(self):
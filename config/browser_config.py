@@ -4,15 +4,35 @@
 """
 import os
 import yaml
-from typing import Dict, Any, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 from utils.cmbird_logger import logger
-from utils.common import load_yaml_with_default, default_config_path
+from utils.common import load_yaml_with_default, default_config_path, flatten_config, readonly_view, YamlDumper
 
 # 使用 cmbird 日志代理（由 BaseTest 在运行时注册）
 
+_DEFAULT_VIEWPORT: Mapping[str, int] = MappingProxyType({"width": 1920, "height": 1080})
+
+# 环境变量 -> (配置键, 类型转换)
+_ENV_MAPPINGS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "BROWSER_TYPE": ("browser.type", str),
+    "BROWSER_HEADLESS": ("browser.headless", lambda v: v.lower() in {"true", "1", "yes", "on"}),
+    "DEFAULT_TIMEOUT": ("timeouts.default", int),
+}
+
 
 class BrowserConfig:
     """浏览器配置管理类"""
+
+    # 按配置文件路径缓存的单例
+    _singletons: Dict[str, "BrowserConfig"] = {}
+
+    # 属性集合固定，使用 __slots__ 省去实例 __dict__
+    __slots__ = (
+        "_config_data", "_config_file", "_flat", "_mtime_ns", "_config_view",
+        "_browser_type", "_default_timeout", "_browser_view", "_timeouts_view", "_viewport_view",
+    )
     
     def __init__(self, config_file: Optional[str] = None):
         """
@@ -22,9 +42,28 @@ class BrowserConfig:
             config_file: 配置文件路径，如果为None则使用默认配置文件
         """
         self._config_data: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
+        self._mtime_ns: Optional[int] = None
         self._config_file = config_file or self._get_default_config_file()
         self._load_config()
 
+    @classmethod
+    def instance(cls, config_file: Optional[str] = None) -> "BrowserConfig":
+        """
+        获取指定配置文件对应的单例
+
+        Args:
+            config_file: 配置文件路径，如果为None则使用默认配置文件
+
+        Returns:
+            BrowserConfig: 配置实例
+        """
+        path = config_file or cls._get_default_config_file()
+        inst = cls._singletons.get(path)
+        if inst is None:
+            inst = cls._singletons[path] = cls(path)
+        return inst
+
     @staticmethod
     def _get_default_config_file() -> str:
         """
@@ -35,14 +74,34 @@ class BrowserConfig:
         """
         return default_config_path()
 
+    def _current_mtime_ns(self) -> Optional[int]:
+        """配置文件修改时间(纳秒)，文件不存在时返回 None"""
+        try:
+            return os.stat(self._config_file).st_mtime_ns
+        except OSError:
+            return None
+
     def _load_config(self) -> None:
         """加载配置文件"""
+        self._mtime_ns = self._current_mtime_ns()
         self._config_data = load_yaml_with_default(
             self._config_file,
             self._get_default_config,
             logger,
             "Browser",
         )
+        self._refresh_cache()
+
+    def _refresh_cache(self) -> None:
+        """根据当前配置重建扁平索引与常用配置值"""
+        self._flat = flatten_config(self._config_data)
+        self._config_view = MappingProxyType(self._config_data)
+        self._browser_type = self._flat.get("browser.type", "chromium")
+        self._default_timeout = self._flat.get("timeouts.default", 10000)
+        # 访问器返回的只读视图，避免每次调用构造新字典
+        self._browser_view = readonly_view(self._flat.get("browser"))
+        self._timeouts_view = readonly_view(self._flat.get("timeouts"))
+        self._viewport_view = readonly_view(self._flat.get("browser.viewport"), _DEFAULT_VIEWPORT)
     
     @staticmethod
     def _get_default_config() -> Dict[str, Any]:
@@ -84,20 +143,7 @@ class BrowserConfig:
         Returns:
             Any: 配置值
         """
-        try:
-            keys = key.split('.')
-            value = self._config_data
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-                    
-            return value
-        except Exception as e:
-            logger.error(f"获取配置值失败: {key}, 错误: {str(e)}")
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -119,28 +165,31 @@ class BrowserConfig:
             
             # 设置最后一级的值
             current_config[keys[-1]] = value
+            self._refresh_cache()
+            # 内存配置已偏离文件，下次 reload 必须重新读取
+            self._mtime_ns = None
             logger.info(f"配置值设置成功: {key} = {value}")
 
         except Exception as e:
             logger.error(f"设置配置值失败: {key}, 错误: {str(e)}")
     
-    def get_browser_config(self) -> Dict[str, Any]:
+    def get_browser_config(self) -> Mapping[str, Any]:
         """
         获取浏览器配置
         
         Returns:
-            Dict[str, Any]: 浏览器配置字典
+            Mapping[str, Any]: 浏览器配置（只读视图）
         """
-        return self.get("browser", {})
+        return self._browser_view
     
-    def get_timeout_config(self) -> Dict[str, int]:
+    def get_timeout_config(self) -> Mapping[str, int]:
         """
         获取超时配置
         
         Returns:
-            Dict[str, int]: 超时配置字典
+            Mapping[str, int]: 超时配置（只读视图）
         """
-        return self.get("timeouts", {})
+        return self._timeouts_view
     
     def get_browser_type(self) -> str:
         """
@@ -149,7 +198,7 @@ class BrowserConfig:
         Returns:
             str: 浏览器类型
         """
-        return self.get("browser.type", "chromium")
+        return self._browser_type
     
     def get_headless(self) -> bool:
         """
@@ -160,14 +209,14 @@ class BrowserConfig:
         """
         return self.get("browser.headless", False)
     
-    def get_viewport(self) -> Dict[str, int]:
+    def get_viewport(self) -> Mapping[str, int]:
         """
         获取视口大小
         
         Returns:
-            Dict[str, int]: 视口大小
+            Mapping[str, int]: 视口大小（只读视图）
         """
-        return self.get("browser.viewport", {"width": 1920, "height": 1080})
+        return self._viewport_view
     
     def get_default_timeout(self) -> int:
         """
@@ -176,7 +225,7 @@ class BrowserConfig:
         Returns:
             int: 默认超时时间(毫秒)
         """
-        return self.get("timeouts.default", 10000)
+        return self._default_timeout
     
     def get_short_timeout(self) -> int:
         """
@@ -213,52 +262,48 @@ class BrowserConfig:
             file_path: 保存路径，如果为None则保存到当前配置文件
         """
         try:
-            save_path = file_path or self._config_file
-            
-            # 确保目录存在
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            
-            with open(save_path, 'w', encoding='utf-8') as file:
-                yaml.dump(self._config_data, file, default_flow_style=False, 
-                         allow_unicode=True, indent=2)
+            save_path = Path(file_path or self._config_file)
+
+            # 目录已存在时跳过 mkdir
+            if not save_path.parent.is_dir():
+                save_path.parent.mkdir(parents=True, exist_ok=True)
+
+            save_path.write_text(
+                yaml.dump(self._config_data, Dumper=YamlDumper, default_flow_style=False,
+                          allow_unicode=True, indent=2),
+                encoding='utf-8',
+            )
             logger.info(f"配置文件保存成功: {save_path}")
 
         except Exception as e:
             logger.error(f"保存配置文件失败: {str(e)}")
     
     def reload_config(self) -> None:
-        """重新加载配置文件"""
+        """重新加载配置文件（文件未修改且无本地改动时跳过）"""
+        mtime_ns = self._current_mtime_ns()
+        if mtime_ns is not None and mtime_ns == self._mtime_ns:
+            logger.debug("配置文件未修改，跳过重新加载")
+            return
         self._load_config()
         logger.info("配置文件重新加载完成")
     
     def update_from_env(self) -> None:
         """从环境变量更新配置"""
-        env_mappings = {
-            "BROWSER_TYPE": "browser.type",
-            "BROWSER_HEADLESS": "browser.headless",
-            "DEFAULT_TIMEOUT": "timeouts.default"
-        }
-        
-        for env_key, config_key in env_mappings.items():
-            env_value = os.getenv(env_key)
-            if env_value is not None:
-                # 类型转换
-                if config_key in ["browser.headless"]:
-                    env_value = env_value.lower() in ('true', '1', 'yes', 'on')
-                elif config_key in ["timeouts.default"]:
-                    env_value = int(env_value)
-                
-                self.set(config_key, env_value)
-                logger.info(f"从环境变量更新配置: {config_key} = {env_value}")
+        # 仅遍历实际设置了的环境变量；未设置时直接返回
+        for env_key in _ENV_MAPPINGS.keys() & os.environ.keys():
+            config_key, caster = _ENV_MAPPINGS[env_key]
+            env_value = caster(os.environ[env_key])
+            self.set(config_key, env_value)
+            logger.info(f"从环境变量更新配置: {config_key} = {env_value}")
 
-    def get_all_config(self) -> Dict[str, Any]:
+    def get_all_config(self) -> Mapping[str, Any]:
         """
-        获取所有配置
+        获取所有配置（只读视图，随 set/reload 同步更新）
         
         Returns:
-            Dict[str, Any]: 所有配置字典
+            Mapping[str, Any]: 所有配置字典
         """
-        return self._config_data.copy()
+        return self._config_view
     
     def __str__(self) -> str:
         """字符串表示"""
@@ -269,5 +314,10 @@ class BrowserConfig:
         return self.__str__()
 
 
+def get_browser_config() -> BrowserConfig:
+    """返回默认配置文件对应的浏览器配置单例。"""
+    return BrowserConfig.instance()
+
+
 # 全局浏览器配置实例
-browser_config = BrowserConfig()
\ No newline at end of file
+browser_config = get_browser_config()
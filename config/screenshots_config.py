@@ -1,9 +1,9 @@
 """
 截图配置管理类
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping
 from utils.cmbird_logger import logger
-from utils.common import load_yaml_with_default, default_config_path
+from utils.common import load_yaml_with_default, default_config_path, flatten_config, readonly_view
 
 # 使用 cmbird 日志代理（由 BaseTest 在运行时注册）
 
@@ -11,11 +11,26 @@ from utils.common import load_yaml_with_default, default_config_path
 class ScreenshotsConfig:
     """截图配置管理类"""
 
+    # 按配置文件路径缓存的单例
+    _singletons: Dict[str, "ScreenshotsConfig"] = {}
+
+    # 属性集合固定，使用 __slots__ 省去实例 __dict__
+    __slots__ = ("_config_data", "_config_file", "_flat", "_screenshots_enabled", "_screenshots_view")
+
     def __init__(self, config_file: Optional[str] = None):
         self._config_data: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._config_file = config_file or self._get_default_config_file()
         self._load_config()
 
+    @classmethod
+    def instance(cls, config_file: Optional[str] = None) -> "ScreenshotsConfig":
+        path = config_file or cls._get_default_config_file()
+        inst = cls._singletons.get(path)
+        if inst is None:
+            inst = cls._singletons[path] = cls(path)
+        return inst
+
     @staticmethod
     def _get_default_config_file() -> str:
         return default_config_path()
@@ -27,6 +42,9 @@ class ScreenshotsConfig:
             logger,
             "Screenshots",
         )
+        self._flat = flatten_config(self._config_data)
+        self._screenshots_enabled = bool(self._flat.get("screenshots.enabled", True))
+        self._screenshots_view = readonly_view(self._flat.get("screenshots"))
 
     @staticmethod
     def _get_default_config() -> Dict[str, Any]:
@@ -41,25 +59,14 @@ class ScreenshotsConfig:
         }
 
     def get(self, key: str, default: Any = None) -> Any:
-        try:
-            keys = key.split('.')
-            value: Any = self._config_data
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            return value
-        except Exception as e:
-            logger.error(f"获取 Screenshots 配置值失败: {key}, 错误: {str(e)}")
-            return default
+        return self._flat.get(key, default)
 
     # 截图配置访问方法
-    def get_screenshot_config(self) -> Dict[str, Any]:
-        return self.get("screenshots", {})
+    def get_screenshot_config(self) -> Mapping[str, Any]:
+        return self._screenshots_view
 
     def screenshots_enabled(self) -> bool:
-        return bool(self.get("screenshots.enabled", True))
+        return self._screenshots_enabled
 
     def screenshots_directory(self) -> str:
         return str(self.get("screenshots.directory", "screenshots"))
@@ -76,4 +83,9 @@ class ScreenshotsConfig:
         return v if isinstance(v, list) else []
 
 
-screenshots_config = ScreenshotsConfig()
\ No newline at end of file
+def get_screenshots_config() -> ScreenshotsConfig:
+    """返回默认配置文件对应的截图配置单例。"""
+    return ScreenshotsConfig.instance()
+
+
+screenshots_config = get_screenshots_config()
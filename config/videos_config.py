@@ -4,9 +4,9 @@
 """
 from __future__ import annotations
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.cmbird_logger import logger
-from utils.common import load_yaml_with_default, default_config_path
+from utils.common import load_yaml_with_default, default_config_path, flatten_config
 
 # 使用 cmbird 日志代理（由 BaseTest 在运行时注册）
 
@@ -16,11 +16,29 @@ class VideosConfig:
 
     VALID_MODES = {"all", "failed_only", "disabled"}
 
+    # 按配置文件路径缓存的单例
+    _singletons: Dict[str, "VideosConfig"] = {}
+
+    # 属性集合固定，使用 __slots__ 省去实例 __dict__
+    __slots__ = (
+        "_config_data", "_config_file", "_flat", "_mode", "_enabled",
+        "_record_all", "_record_failed_only", "_size_wh",
+    )
+
     def __init__(self, config_file: Optional[str] = None) -> None:
         self._config_data: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._config_file = config_file or self._get_default_config_file()
         self._load_config()
 
+    @classmethod
+    def instance(cls, config_file: Optional[str] = None) -> "VideosConfig":
+        path = config_file or cls._get_default_config_file()
+        inst = cls._singletons.get(path)
+        if inst is None:
+            inst = cls._singletons[path] = cls(path)
+        return inst
+
     @staticmethod
     def _get_default_config_file() -> str:
         return default_config_path()
@@ -32,6 +50,13 @@ class VideosConfig:
             logger,
             "Videos",
         )
+        self._flat = flatten_config(self._config_data)
+        # 校验后的结果只计算一次，访问器直接返回
+        self._mode = self._resolve_mode()
+        self._enabled = self._mode != "disabled"
+        self._record_all = self._mode == "all"
+        self._record_failed_only = self._mode == "failed_only"
+        self._size_wh = self._resolve_size()
 
     @staticmethod
     def _get_default_config() -> Dict[str, Any]:
@@ -44,48 +69,49 @@ class VideosConfig:
         }
 
     def get(self, key: str, default: Any = None) -> Any:
-        try:
-            keys = key.split(".")
-            value: Any = self._config_data
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            return value
-        except Exception as e:
-            logger.error(f"获取 Videos 配置值失败: {key}, 错误: {str(e)}")
-            return default
+        return self._flat.get(key, default)
 
-    # 访问器
-    def mode(self) -> str:
+    def _resolve_mode(self) -> str:
         m = str(self.get("videos.mode", "disabled")).lower()
         if m not in self.VALID_MODES:
             logger.warning(f"非法视频模式: {m}，回退为 disabled")
             return "disabled"
         return m
 
+    def _resolve_size(self) -> Tuple[int, int]:
+        size = self.get("videos.size", {"width": 1280, "height": 720})
+        try:
+            w = int(size.get("width", 1280))
+            h = int(size.get("height", 720))
+            return max(1, w), max(1, h)
+        except Exception as e:
+            logger.warning(f"视频分辨率配置不合法，使用默认 1280x720, 错误: {str(e)}")
+            return 1280, 720
+
+    # 访问器
+    def mode(self) -> str:
+        return self._mode
+
     def enabled(self) -> bool:
-        return self.mode() != "disabled"
+        return self._enabled
 
     def record_all(self) -> bool:
-        return self.mode() == "all"
+        return self._record_all
 
     def record_failed_only(self) -> bool:
-        return self.mode() == "failed_only"
+        return self._record_failed_only
 
     def directory(self) -> str:
         return str(self.get("videos.directory", "videos"))
 
     def size(self) -> Dict[str, int]:
-        size = self.get("videos.size", {"width": 1280, "height": 720})
-        try:
-            w = int(size.get("width", 1280))
-            h = int(size.get("height", 720))
-            return {"width": max(1, w), "height": max(1, h)}
-        except Exception as e:
-            logger.warning(f"视频分辨率配置不合法，使用默认 1280x720, 错误: {str(e)}")
-            return {"width": 1280, "height": 720}
+        w, h = self._size_wh
+        return {"width": w, "height": h}
+
+
+def get_videos_config() -> VideosConfig:
+    """返回默认配置文件对应的视频配置单例。"""
+    return VideosConfig.instance()
 
 
-videos_config = VideosConfig()
\ No newline at end of file
+videos_config = get_videos_config()
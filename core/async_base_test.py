@@ -0,0 +1,95 @@
+"""
+异步测试基类
+基于 unittest.IsolatedAsyncioTestCase 与 playwright.async_api，
+同一测试方法内可并发驱动多个浏览器上下文，等待浏览器响应的时间相互重叠。
+
+异步 Playwright 对象绑定在创建它的事件循环上，而 IsolatedAsyncioTestCase 为每个测试方法
+新建事件循环，因此浏览器在 asyncSetUp 中启动、asyncTearDown 中关闭，随测试方法一同创建与释放。
+"""
+import asyncio
+import unittest
+from typing import Any, Awaitable, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+
+from core.base_test import get_browser_settings
+from core.browser_manager import context_options
+from utils.cmbird_logger import logger, set_current_logger, clear_current_logger
+
+
+class AsyncBaseTest(unittest.IsolatedAsyncioTestCase):
+    """异步测试基类"""
+
+    playwright: Optional[Playwright] = None
+    browser: Optional[Browser] = None
+    context: Optional[BrowserContext] = None
+    page: Optional[Page] = None
+
+    async def _launch_browser(self) -> None:
+        """启动当前测试方法使用的浏览器"""
+        settings = get_browser_settings()
+        self.playwright = await async_playwright().start()
+        launcher = getattr(self.playwright, settings.browser_type, None)
+        if launcher is None:
+            raise ValueError(f"不支持的浏览器类型: {settings.browser_type}")
+        self.browser = await launcher.launch(
+            headless=settings.headless,
+            slow_mo=settings.slow_mo,
+            args=list(settings.args),
+        )
+
+    async def _close_browser(self) -> None:
+        """关闭当前测试方法使用的浏览器"""
+        try:
+            if self.browser:
+                # 关闭浏览器会一并关闭其下所有上下文
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            logger.debug(f"关闭异步浏览器时出现异常: {str(e)}")
+        finally:
+            self.browser = None
+            self.playwright = None
+
+    async def asyncSetUp(self) -> None:
+        set_current_logger(getattr(self, "logger", None))
+        logger.info(f"开始执行异步测试方法: {self._testMethodName}")
+        # 以清理函数关闭浏览器：即使后续初始化失败、asyncTearDown 未执行也会释放
+        self.addAsyncCleanup(self._close_browser)
+        await self._launch_browser()
+        self.context = await self.new_context()
+        self.page = await self.context.new_page()
+
+    async def asyncTearDown(self) -> None:
+        try:
+            if self.context:
+                await self.context.close()
+        except Exception as e:
+            logger.debug(f"关闭异步上下文时出现异常: {str(e)}")
+        finally:
+            self.context = None
+            self.page = None
+            clear_current_logger()
+
+    async def new_context(self) -> BrowserContext:
+        """按浏览器配置创建新的上下文，用于并发场景中相互隔离的会话"""
+        settings = get_browser_settings()
+        # 与同步 BaseTest 使用同一套上下文参数（默认视口、请求头、视频录制等）
+        context = await self.browser.new_context(**context_options(**settings.context_kwargs))
+        context.set_default_timeout(settings.default_timeout)
+        context.set_default_navigation_timeout(settings.navigation_timeout)
+        return context
+
+    @staticmethod
+    async def run_concurrent(*coros: Awaitable[Any]) -> List[Any]:
+        """
+        并发执行多个协程
+
+        Args:
+            *coros: 协程对象
+
+        Returns:
+            List[Any]: 按传入顺序排列的结果；任一协程异常时向上抛出
+        """
+        return list(await asyncio.gather(*coros))
@@ -1,18 +1,154 @@
+from __future__ import annotations
+
 import fnmatch
+import functools
+import logging
+import re
 import time
+from collections import OrderedDict
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Union, Callable, ClassVar, Literal, Set, Tuple
 
-from playwright.sync_api import Page, Locator, expect, Error, Cookie, FrameLocator
+from playwright.sync_api import Error, expect
 from utils.cmbird_logger import logger
 
+if TYPE_CHECKING:
+    # 仅用于类型注解
+    from playwright.sync_api import Page, Locator, Cookie, FrameLocator, JSHandle
+
 # 定义选择器类型
-SelectorType = Union[str, Locator]
+SelectorType = Union[str, "Locator"]
+
+# 每个页面对象缓存的 Locator 数量上限
+LOCATOR_CACHE_SIZE = 512
+
+# 条件轮询的初始间隔(秒)，之后按指数退避增长到 poll_interval
+INITIAL_POLL_INTERVAL = 0.025
+
+# 在浏览器端逐帧比较元素矩形，连续 stableMs 毫秒未变化时返回 true；
+# token 区分不同调用，避免沿用上一次等待遗留的状态
+_ELEMENT_STABLE_JS = """
+({ el, stableMs, token }) => {
+    const r = el.getBoundingClientRect();
+    const key = `${r.x},${r.y},${r.width},${r.height}`;
+    const now = performance.now();
+    const state = el.__pwStableState;
+    if (!state || state.token !== token || state.key !== key) {
+        el.__pwStableState = { token, key, since: now };
+        return false;
+    }
+    return now - state.since >= stableMs;
+}
+"""
+
+# 将脚本源码编译为浏览器端的 thunk：调用时求值表达式，若结果是函数则以参数调用
+_COMPILE_SCRIPT_JS = "src => new Function('return (' + src + ')')"
+_INVOKE_SCRIPT_JS = "(thunk, arg) => { const v = thunk(); return typeof v === 'function' ? v(arg) : v; }"
+
+# 批量赋值输入框并派发 input/change 事件，返回未找到的选择器
+_FILL_MANY_JS = """
+(fields) => {
+    const missing = [];
+    for (const [sel, val] of Object.entries(fields)) {
+        const el = document.querySelector(sel);
+        if (!el) { missing.push(sel); continue; }
+        el.value = val;
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    return missing;
+}
+"""
+
+# 所有选择器都匹配到可见元素（非空尺寸且未 visibility:hidden）时返回 true；
+# 每轮逐个查询全部选择器，querySelector 无法解析的选择器在首轮即抛出 SyntaxError
+_ALL_VISIBLE_JS = """
+(selectors) => selectors.map(sel => {
+    const el = document.querySelector(sel);
+    if (!el) return false;
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+}).every(Boolean)
+"""
+
+# 返回未匹配到可见元素的选择器，判定与 _ALL_VISIBLE_JS 一致
+_HIDDEN_SELECTORS_JS = """
+(selectors) => selectors.filter(sel => {
+    const el = document.querySelector(sel);
+    if (!el) return true;
+    const r = el.getBoundingClientRect();
+    return !(r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden');
+})
+"""
+
+
+@functools.lru_cache(maxsize=512)
+def _url_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    为 URL 模式生成匹配函数，结果按模式缓存
+
+    - 含通配符：子串命中或通配符正则匹配
+    - 不含通配符的完整地址（http 开头）：前缀或子串匹配（跳转包装、查询参数中的地址也能命中）
+    - 其余：子串匹配
+    """
+    if any(ch in pattern for ch in "*?["):
+        match = re.compile(fnmatch.translate(pattern)).match
+        return lambda url: pattern in url or match(url) is not None
+    if pattern.startswith("http"):
+        return lambda url: url.startswith(pattern) or pattern in url
+    return lambda url: pattern in url
+
+
+def _logged_action(success: str, failure: str, value_arg: Optional[str] = None) -> Callable:
+    """
+    页面操作日志装饰器：成功记录 info，失败记录 error 后重新抛出
+
+    被装饰方法的第一个参数为选择器；value_arg 指定需要一并记录的第二个参数名。
+
+    Args:
+        success: 成功日志格式
+        failure: 失败日志格式（自动追加错误信息）
+        value_arg: 记录的取值参数名
+    """
+    failure = failure + " | 错误: %s"
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, selector, *args, **kwargs):
+            try:
+                result = func(self, selector, *args, **kwargs)
+            except Exception as e:
+                if value_arg is None:
+                    logger.error(failure, self._describe(selector), e)
+                else:
+                    logger.error(failure, self._describe(selector), args[0] if args else kwargs.get(value_arg), e)
+                raise
+            if logger.isEnabledFor(logging.INFO):
+                if value_arg is None:
+                    logger.info(success, self._describe(selector))
+                else:
+                    logger.info(success, self._describe(selector), args[0] if args else kwargs.get(value_arg))
+            return result
+        return wrapper
+    return decorator
 
 
 class BasePage(ABC):
     """页面对象模型基类"""
 
+    # 子类可声明 语义名 -> 选择器，构造时预建 Locator，并可通过 loc(name) 获取
+    SELECTORS: ClassVar[Dict[str, str]] = {}
+
+    # 超时时间(毫秒)，子类可覆盖
+    timeout: ClassVar[int] = 10000  # 默认超时时间 10 秒
+    short_timeout: ClassVar[int] = 3000  # 短超时时间 3 秒
+    long_timeout: ClassVar[int] = 30000  # 长超时时间 30 秒
+
+    __slots__ = (
+        "page", "_locator_cache", "_script_cache", "_uncompilable_scripts", "_pending_cookies",
+        "_cached_url", "_cached_title", "_cached_viewport", "_listeners",
+    )
+
     def __init__(self, page: Page):
         """
         初始化基础页面
@@ -21,9 +157,68 @@ class BasePage(ABC):
             page: Playwright 页面实例
         """
         self.page = page
-        self.timeout = 10000  # 默认超时时间 10 秒
-        self.short_timeout = 3000  # 短超时时间 3 秒
-        self.long_timeout = 30000  # 长超时时间 30 秒
+        # 字符串选择器 -> Locator 缓存，页面文档变化时清空
+        self._locator_cache: OrderedDict[str, Locator] = OrderedDict()
+        for selector in self.SELECTORS.values():
+            self._locator_cache[selector] = page.locator(selector)
+        # 脚本源码 -> 已编译函数句柄，句柄属于当前执行上下文，主框架导航后释放并清空
+        self._script_cache: Dict[str, JSHandle] = {}
+        # 无法编译为表达式的脚本（语句式脚本、CSP 禁止 new Function），直接走 page.evaluate
+        self._uncompilable_scripts: Set[str] = set()
+        # set_cookie(defer=True) 暂存的 cookie，flush_cookies 或 navigate 时一次性写入
+        self._pending_cookies: List[Dict[str, Any]] = []
+        # URL/标题/视口缓存：主框架导航或 DOM 重新加载时失效，视口在 set_viewport_size 时更新
+        self._cached_url: Optional[str] = None
+        self._cached_title: Optional[str] = None
+        self._cached_viewport: Optional[Dict[str, int]] = None
+        # 以普通函数注册监听：同步 API 会把绑定方法的包装挂到实例属性上，而 __slots__ 实例没有 __dict__；
+        # 保留同一函数对象以便 detach 时移除
+        self._listeners: Tuple[Tuple[str, Callable[..., None]], ...] = (
+            ("framenavigated", lambda frame: self._on_frame_navigated(frame)),
+            ("domcontentloaded", lambda loaded_page: self._on_dom_content_loaded(loaded_page)),
+        )
+        for event, handler in self._listeners:
+            page.on(event, handler)
+
+    def _on_frame_navigated(self, frame) -> None:
+        """主框架导航后使 URL、标题与脚本句柄缓存失效"""
+        if frame == self.page.main_frame:
+            self._cached_url = None
+            self._cached_title = None
+            self._clear_script_cache()
+
+    def detach(self) -> None:
+        """
+        解除页面对象与 Page 的事件绑定并释放脚本句柄
+
+        页面对象被替换或不再使用时调用；否则监听器会随每次构造在 Page 上累积，
+        并使已废弃的页面对象无法被回收。
+        """
+        for event, handler in self._listeners:
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception as e:
+                logger.debug(f"移除页面事件监听失败: {str(e)}")
+        self._listeners = ()
+        if not self.page.is_closed():
+            self._clear_script_cache()
+        else:
+            self._script_cache.clear()
+
+    def _clear_script_cache(self) -> None:
+        """释放并清空已编译的脚本句柄"""
+        handles = list(self._script_cache.values())
+        self._script_cache.clear()
+        for handle in handles:
+            try:
+                handle.dispose()
+            except Error:
+                # 所属执行上下文已销毁，浏览器端句柄已随之释放
+                pass
+
+    def _on_dom_content_loaded(self, _page: Page) -> None:
+        """文档重新加载后使标题缓存失效"""
+        self._cached_title = None
 
     @property
     @abstractmethod
@@ -51,12 +246,16 @@ class BasePage(ABC):
         """
         target_url = url or self.url
         try:
+            self.flush_cookies()
+            # 导航前释放脚本句柄，此时执行上下文仍有效
+            self._clear_script_cache()
             self.page.goto(target_url, wait_until=wait_until, timeout=self.long_timeout)
+            self.clear_locator_cache()
             self.wait_for_page_load()
-            logger.info(f"页面导航成功: {target_url}")
+            logger.info("页面导航成功: %s", target_url)
             return self
         except Exception as e:
-            logger.error(f"页面导航失败: {target_url} | 错误: {str(e)}")
+            logger.error("页面导航失败: %s | 错误: %s", target_url, e)
             raise
 
     def wait_for_page_load(self, timeout: Optional[int] = None) -> None:
@@ -68,12 +267,12 @@ class BasePage(ABC):
         """
         timeout = timeout or self.long_timeout
         try:
-            self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+            # networkidle 必然晚于 domcontentloaded，单独等待即可
             self.page.wait_for_load_state("networkidle", timeout=timeout)
         except Exception as e:
-            logger.warning(f"等待页面加载超时: {str(e)}")
+            logger.warning("等待页面加载超时: %s", e)
 
-    def _resolve_selector(self, selector: SelectorType) -> Locator | None:
+    def _resolve_selector(self, selector: SelectorType) -> Locator:
         """
         解析选择器，支持字符串选择器和Playwright内置选择器
 
@@ -83,11 +282,39 @@ class BasePage(ABC):
         Returns:
             Locator对象
         """
-        if isinstance(selector, str):
-            return self.page.locator(selector)
-        elif isinstance(selector, Locator):
-            return selector
-        return None
+        if type(selector) is str:
+            cache = self._locator_cache
+            locator = cache.get(selector)
+            if locator is None:
+                locator = cache[selector] = self.page.locator(selector)
+                if len(cache) > LOCATOR_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(selector)
+            return locator
+        # 只接受字符串与 Locator 两种类型
+        return selector
+
+    @staticmethod
+    def _describe(selector: SelectorType) -> str:
+        """选择器的日志描述"""
+        return selector if type(selector) is str else f"Locator({selector})"
+
+    def loc(self, name: str) -> Locator:
+        """
+        按 SELECTORS 中的语义名获取 Locator
+
+        Args:
+            name: SELECTORS 中声明的名称
+
+        Returns:
+            Locator对象
+        """
+        return self._resolve_selector(self.SELECTORS[name])
+
+    def clear_locator_cache(self) -> None:
+        """清空 Locator 缓存（导航、刷新、前进后退、切换 iframe 后调用）"""
+        self._locator_cache.clear()
 
     def get_element(self, selector: SelectorType, timeout: Optional[int] = None) -> Locator:
         """
@@ -107,10 +334,11 @@ class BasePage(ABC):
             element.wait_for(state="visible", timeout=timeout)
             return element
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"获取元素失败: {selector_desc}, 错误: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("获取元素失败: %s, 错误: %s", selector_desc, e)
             raise
 
+    @_logged_action("元素点击成功: %s", "元素点击失败: %s")
     def click(self, selector: SelectorType, timeout: Optional[int] = None, force: bool = False) -> 'BasePage':
         """
         点击元素
@@ -124,17 +352,11 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            element.click(force=force, timeout=timeout)
-            logger.info(f"元素点击成功: {selector_desc}")
-            return self
-        except Exception as e:
-            logger.error(f"元素点击失败: {selector_desc} | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        element.click(force=force, timeout=timeout)
+        return self
 
+    @_logged_action("元素双击成功: %s", "元素双击失败: %s")
     def double_click(self, selector: SelectorType, timeout: Optional[int] = None) -> 'BasePage':
         """
         双击元素
@@ -147,17 +369,11 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            element.dblclick(timeout=timeout)
-            logger.info(f"元素双击成功: {selector_desc}")
-            return self
-        except Exception as e:
-            logger.error(f"元素双击失败: {selector_desc} | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        element.dblclick(timeout=timeout)
+        return self
 
+    @_logged_action("元素填充成功: %s = '%s'", "元素填充失败: %s = '%s'", value_arg="value")
     def fill(self, selector: SelectorType, value: str, timeout: Optional[int] = None, clear: bool = True) -> 'BasePage':
         """
         填充输入框
@@ -172,19 +388,13 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            if clear:
-                element.clear(timeout=timeout)
-            element.fill(value, timeout=timeout)
-            logger.info(f"元素填充成功: {selector_desc} = '{value}'")
-            return self
-        except Exception as e:
-            logger.error(f"元素填充失败: {selector_desc} = '{value}' | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        if clear:
+            element.clear(timeout=timeout)
+        element.fill(value, timeout=timeout)
+        return self
 
+    @_logged_action("文本输入成功: %s = '%s'", "文本输入失败: %s = '%s'", value_arg="text")
     def type_text(self, selector: SelectorType, text: str, delay: int = 100,
                   timeout: Optional[int] = None) -> 'BasePage':
         """
@@ -200,17 +410,11 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            element.type(text, delay=delay, timeout=timeout)
-            logger.info(f"文本输入成功: {selector_desc} = '{text}'")
-            return self
-        except Exception as e:
-            logger.error(f"文本输入失败: {selector_desc} = '{text}' | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        element.type(text, delay=delay, timeout=timeout)
+        return self
 
+    @_logged_action("选项选择成功: %s = '%s'", "选项选择失败: %s = '%s'", value_arg="value")
     def select_option(self, selector: SelectorType, value: Union[str, List[str]],
                       timeout: Optional[int] = None) -> 'BasePage':
         """
@@ -225,17 +429,11 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            element.select_option(value, timeout=timeout)
-            logger.info(f"选项选择成功: {selector_desc} = '{value}'")
-            return self
-        except Exception as e:
-            logger.error(f"选项选择失败: {selector_desc} = '{value}' | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        element.select_option(value, timeout=timeout)
+        return self
 
+    @_logged_action("复选框勾选成功: %s", "复选框勾选失败: %s")
     def check(self, selector: SelectorType, timeout: Optional[int] = None) -> 'BasePage':
         """
         勾选复选框或单选框
@@ -248,17 +446,11 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            element.check(timeout=timeout)
-            logger.info(f"复选框勾选成功: {selector_desc}")
-            return self
-        except Exception as e:
-            logger.error(f"复选框勾选失败: {selector_desc} | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        element.check(timeout=timeout)
+        return self
 
+    @_logged_action("☐ 复选框取消勾选成功: %s", "复选框取消勾选失败: %s")
     def uncheck(self, selector: SelectorType, timeout: Optional[int] = None) -> 'BasePage':
         """
         取消勾选复选框
@@ -271,17 +463,11 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-
-        try:
-            element = self.get_element(selector, timeout)
-            element.uncheck(timeout=timeout)
-            logger.info(f"☐ 复选框取消勾选成功: {selector_desc}")
-            return self
-        except Exception as e:
-            logger.error(f"复选框取消勾选失败: {selector_desc} | 错误: {str(e)}")
-            raise
+        element = self.get_element(selector, timeout)
+        element.uncheck(timeout=timeout)
+        return self
 
+    @_logged_action("元素悬停成功: %s", "元素悬停失败: %s")
     def hover(self, selector: SelectorType, timeout: Optional[int] = None) -> 'BasePage':
         """
         悬停在元素上
@@ -294,17 +480,48 @@ class BasePage(ABC):
             页面实例
         """
         timeout = timeout or self.timeout
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
+        element = self.get_element(selector, timeout)
+        element.hover(timeout=timeout)
+        return self
+
+    def fill_many(self, fields: Dict[str, str]) -> 'BasePage':
+        """
+        一次浏览器调用批量填充输入框（快速路径）
+
+        直接设置 value 并派发 input/change 事件，跳过 Playwright 的可见、可用等可操作性检查，
+        仅适用于结构已知且可信的页面；选择器须为 CSS 选择器。
+
+        Args:
+            fields: 选择器 -> 输入值
 
+        Returns:
+            页面实例
+        """
         try:
-            element = self.get_element(selector, timeout)
-            element.hover(timeout=timeout)
-            logger.info(f"元素悬停成功: {selector_desc}")
+            missing = self._evaluate_cached(_FILL_MANY_JS, fields)
+            if missing:
+                logger.warning("批量填充未找到元素: %s", missing)
+            logger.info("批量填充完成: %s 个字段", len(fields) - len(missing or []))
             return self
         except Exception as e:
-            logger.error(f"元素悬停失败: {selector_desc} | 错误: {str(e)}")
+            logger.error("批量填充失败: %s", e)
             raise
 
+    def fill_many_safe(self, fields: Dict[SelectorType, str], timeout: Optional[int] = None) -> 'BasePage':
+        """
+        批量填充输入框，逐个走 fill 的可操作性检查
+
+        Args:
+            fields: 选择器（字符串或Locator）-> 输入值
+            timeout: 单个字段的超时时间
+
+        Returns:
+            页面实例
+        """
+        for selector, value in fields.items():
+            self.fill(selector, value, timeout)
+        return self
+
     def scroll_to(self, selector: Optional[SelectorType] = None, x: Optional[int] = None,
                   y: Optional[int] = None) -> 'BasePage':
         """
@@ -322,14 +539,14 @@ class BasePage(ABC):
             if selector:
                 element = self.get_element(selector)
                 element.scroll_into_view_if_needed()
-                selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-                logger.info(f"成功滚动到元素: {selector_desc}")
+                selector_desc = self._describe(selector)
+                logger.info("成功滚动到元素: %s", selector_desc)
             elif x is not None and y is not None:
-                self.page.evaluate(f"window.scrollTo({x}, {y})")
-                logger.info(f"成功滚动到坐标: ({x}, {y})")
+                self._evaluate_cached("([x, y]) => window.scrollTo(x, y)", [x, y])
+                logger.info("成功滚动到坐标: (%s, %s)", x, y)
             return self
         except Exception as e:
-            logger.error(f"滚动失败, 错误: {str(e)}")
+            logger.error("滚动失败, 错误: %s", e)
             raise
 
     def wait_for_element(self, selector: SelectorType,
@@ -350,14 +567,43 @@ class BasePage(ABC):
         try:
             element = self._resolve_selector(selector)
             element.wait_for(state=state, timeout=timeout)
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"元素状态满足条件: {selector_desc}, 状态: {state}")
+            selector_desc = self._describe(selector)
+            logger.info("元素状态满足条件: %s, 状态: %s", selector_desc, state)
             return element
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"等待元素失败: {selector_desc}, 状态: {state}, 错误: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("等待元素失败: %s, 状态: %s, 错误: %s", selector_desc, state, e)
             raise
 
+    def expect_all_visible(self, *selectors: str, timeout: int = 5000) -> None:
+        """
+        断言多个元素均可见
+
+        先以一次浏览器端轮询检查全部选择器；其中含 querySelector 无法解析的
+        Playwright 扩展语法（:has-text、text=、>> 等）时，改为逐个使用 expect 断言。
+
+        Args:
+            *selectors: 元素选择器
+            timeout: 超时时间，默认与 expect 一致
+
+        Raises:
+            AssertionError: 存在不可见的元素
+        """
+        try:
+            self.page.wait_for_function(_ALL_VISIBLE_JS, arg=list(selectors), polling="raf", timeout=timeout)
+            return
+        except Error as e:
+            if "SyntaxError" not in str(e):
+                # 超时后再取一次，错误信息只列出仍不可见的元素
+                try:
+                    hidden = self.page.evaluate(_HIDDEN_SELECTORS_JS, list(selectors)) or selectors
+                except Error:
+                    hidden = selectors
+                raise AssertionError(f"元素不可见: {', '.join(hidden)}") from e
+        logger.debug("选择器含 Playwright 扩展语法，逐个断言可见: %s", ", ".join(selectors))
+        for selector in selectors:
+            expect(self.page.locator(selector)).to_be_visible(timeout=timeout)
+
     def wait_for_element_stable(self, selector: SelectorType, stable_time: int = 500,
                                 timeout: Optional[int] = None) -> Locator:
         """
@@ -377,31 +623,24 @@ class BasePage(ABC):
             # 先等待元素可见
             element.wait_for(state="visible", timeout=timeout)
 
-            # 等待元素位置稳定
-            last_box = None
-            stable_start = None
-
-            while True:
-                current_box = element.bounding_box()
-                current_time = time.time() * 1000
-
-                if last_box == current_box:
-                    if stable_start is None:
-                        stable_start = current_time
-                    elif current_time - stable_start >= stable_time:
-                        break
-                else:
-                    stable_start = None
-                    last_box = current_box
-
-                time.sleep(0.1)
-
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"元素已稳定: {selector_desc}")
+            # 在浏览器端按动画帧检查位置是否稳定，只需一次往返
+            handle = element.element_handle(timeout=timeout)
+            try:
+                self.page.wait_for_function(
+                    _ELEMENT_STABLE_JS,
+                    arg={"el": handle, "stableMs": stable_time, "token": time.monotonic_ns()},
+                    polling="raf",
+                    timeout=timeout,
+                )
+            finally:
+                handle.dispose()
+
+            selector_desc = self._describe(selector)
+            logger.info("元素已稳定: %s", selector_desc)
             return element
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"等待元素稳定失败: {selector_desc}, 错误: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("等待元素稳定失败: %s, 错误: %s", selector_desc, e)
             raise
 
     def wait_for_text(self, selector: SelectorType, text: str, timeout: Optional[int] = None) -> bool:
@@ -419,13 +658,14 @@ class BasePage(ABC):
         timeout = timeout or self.timeout
         try:
             element = self._resolve_selector(selector)
-            expect(element).to_contain_text(text, timeout=timeout)
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"元素包含期望文本: {selector_desc}, 文本: {text}")
+            # 由浏览器端按文本过滤并等待，文本出现即返回
+            element.filter(has_text=text).first.wait_for(state="visible", timeout=timeout)
+            selector_desc = self._describe(selector)
+            logger.info("元素包含期望文本: %s, 文本: %s", selector_desc, text)
             return True
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"等待文本失败: {selector_desc}, 文本: {text}, 错误: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("等待文本失败: %s, 文本: %s, 错误: %s", selector_desc, text, e)
             return False
 
     def get_text(self, selector: SelectorType, timeout: Optional[int] = None) -> str:
@@ -443,12 +683,12 @@ class BasePage(ABC):
         try:
             element = self.get_element(selector, timeout)
             text = element.text_content()
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"元素文本获取成功: {selector_desc} = '{text}'")
+            selector_desc = self._describe(selector)
+            logger.info("元素文本获取成功: %s = '%s'", selector_desc, text)
             return text or ""
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"元素文本获取失败: {selector_desc} | 错误: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("元素文本获取失败: %s | 错误: %s", selector_desc, e)
             raise
 
     def get_attribute(self, selector: SelectorType, attribute: str, timeout: Optional[int] = None) -> Optional[str]:
@@ -467,17 +707,17 @@ class BasePage(ABC):
         try:
             element = self.get_element(selector, timeout)
             value = element.get_attribute(attribute)
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"元素属性获取成功: {selector_desc}[{attribute}] = '{value}'")
+            selector_desc = self._describe(selector)
+            logger.info("元素属性获取成功: %s[%s] = '%s'", selector_desc, attribute, value)
             return value
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"元素属性获取失败: {selector_desc}[{attribute}] | 错误: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("元素属性获取失败: %s[%s] | 错误: %s", selector_desc, attribute, e)
             raise
 
     def is_visible(self, selector: SelectorType, timeout: Optional[int] = None) -> bool:
         """
-        检查元素是否可见
+        检查元素当前是否可见（立即返回，不等待；需要等待时使用 wait_until_visible）
 
         Args:
             selector: 元素选择器（字符串或Playwright内置选择器）
@@ -493,6 +733,28 @@ class BasePage(ABC):
         except (Error, TimeoutError):
             return False
 
+    def wait_until_visible(self, selector: SelectorType, timeout: Optional[int] = None) -> bool:
+        """
+        等待元素在超时内变为可见
+
+        Args:
+            selector: 元素选择器（字符串或Playwright内置选择器）
+            timeout: 超时时间
+
+        Returns:
+            超时内是否变为可见
+        """
+        timeout = timeout or self.short_timeout
+        try:
+            if type(selector) is str:
+                # 订阅浏览器端的可见性变化，元素出现即返回，无需外层重试
+                self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            else:
+                selector.wait_for(state="visible", timeout=timeout)
+            return True
+        except (Error, TimeoutError):
+            return False
+
     def is_enabled(self, selector: SelectorType, timeout: Optional[int] = None) -> bool:
         """
         检查元素是否可用
@@ -518,7 +780,10 @@ class BasePage(ABC):
         Returns:
             当前 URL
         """
-        return self.page.url
+        url = self._cached_url
+        if url is None:
+            url = self._cached_url = self.page.url
+        return url
 
     def get_current_title(self) -> str:
         """
@@ -526,8 +791,14 @@ class BasePage(ABC):
 
         Returns:
             当前标题
+
+        Note:
+            标题在导航或文档加载后重新读取；脚本运行中修改 document.title 不会使缓存失效
         """
-        return self.page.title()
+        title = self._cached_title
+        if title is None:
+            title = self._cached_title = self.page.title()
+        return title
 
     def refresh(self) -> 'BasePage':
         """
@@ -537,11 +808,13 @@ class BasePage(ABC):
             页面实例
         """
         try:
+            self._clear_script_cache()
             self.page.reload(wait_until="domcontentloaded", timeout=self.long_timeout)
+            self.clear_locator_cache()
             logger.info("页面刷新成功")
             return self
         except Exception as e:
-            logger.error(f"页面刷新失败: {str(e)}")
+            logger.error("页面刷新失败: %s", e)
             raise
 
     def go_back(self) -> 'BasePage':
@@ -552,11 +825,13 @@ class BasePage(ABC):
             页面实例
         """
         try:
+            self._clear_script_cache()
             self.page.go_back(wait_until="domcontentloaded", timeout=self.long_timeout)
+            self.clear_locator_cache()
             logger.info("返回上一页成功")
             return self
         except Exception as e:
-            logger.error(f"返回上一页失败: {str(e)}")
+            logger.error("返回上一页失败: %s", e)
             raise
 
     def go_forward(self) -> 'BasePage':
@@ -567,11 +842,13 @@ class BasePage(ABC):
             页面实例
         """
         try:
+            self._clear_script_cache()
             self.page.go_forward(wait_until="domcontentloaded", timeout=self.long_timeout)
+            self.clear_locator_cache()
             logger.info("前进到下一页成功")
             return self
         except Exception as e:
-            logger.error(f"前进到下一页失败: {str(e)}")
+            logger.error("前进到下一页失败: %s", e)
             raise
 
     def execute_script(self, script: str, *args) -> Any:
@@ -586,13 +863,37 @@ class BasePage(ABC):
             脚本执行结果
         """
         try:
-            result = self.page.evaluate(script, *args)
-            logger.info(f"执行脚本成功: {script[:100]}...")
+            result = self._evaluate_cached(script, *args)
+            logger.info("执行脚本成功: %s...", script[:100])
             return result
         except Exception as e:
-            logger.error(f"执行脚本失败: {script[:100]}..., 错误: {str(e)}")
+            logger.error("执行脚本失败: %s..., 错误: %s", script[:100], e)
             raise
 
+    def _evaluate_cached(self, script: str, arg: Any = None) -> Any:
+        """
+        以缓存的函数句柄执行脚本，同一脚本在浏览器端只编译一次
+
+        编译失败的脚本（语句式脚本、CSP 禁止 new Function）记录后直接使用 page.evaluate；
+        执行期间发生主框架导航导致句柄失效时回退到 page.evaluate。
+        """
+        if script in self._uncompilable_scripts:
+            return self.page.evaluate(script, arg)
+        handle = self._script_cache.get(script)
+        if handle is None:
+            try:
+                handle = self._script_cache[script] = self.page.evaluate_handle(_COMPILE_SCRIPT_JS, script)
+            except Error:
+                self._uncompilable_scripts.add(script)
+                return self.page.evaluate(script, arg)
+        try:
+            return handle.evaluate(_INVOKE_SCRIPT_JS, arg)
+        except Error:
+            # 导航事件已使该句柄出缓存，说明失败源于执行上下文销毁；否则是脚本自身的错误
+            if self._script_cache.get(script) is handle:
+                raise
+            return self.page.evaluate(script, arg)
+
     def wait(self, seconds: float) -> 'BasePage':
         """
         等待指定时间
@@ -603,7 +904,7 @@ class BasePage(ABC):
         Returns:
             页面实例
         """
-        logger.info(f"等待 {seconds} 秒")
+        logger.info("等待 %s 秒", seconds)
         time.sleep(seconds)
         return self
 
@@ -614,13 +915,14 @@ class BasePage(ABC):
         Args:
             condition_func: 条件函数，返回True时停止等待
             timeout: 超时时间(毫秒)
-            poll_interval: 轮询间隔(秒)
+            poll_interval: 最大轮询间隔(秒)，从 25ms 起指数退避至该值
 
         Returns:
             页面实例
         """
         timeout = timeout or self.timeout
-        start_time = time.time() * 1000
+        deadline_ns = time.monotonic_ns() + timeout * 1_000_000
+        interval = INITIAL_POLL_INTERVAL
 
         while True:
             try:
@@ -630,12 +932,13 @@ class BasePage(ABC):
             except (Error, TimeoutError, AssertionError):
                 pass
 
-            current_time = time.time() * 1000
-            if current_time - start_time >= timeout:
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
                 logger.warning("智能等待超时")
                 raise TimeoutError(f"智能等待超时: {timeout}ms")
 
-            time.sleep(poll_interval)
+            time.sleep(min(interval, remaining_ns / 1e9))
+            interval = min(interval * 2, poll_interval)
 
     def wait_for_network_idle(self, timeout: Optional[int] = None) -> 'BasePage':
         """
@@ -653,7 +956,7 @@ class BasePage(ABC):
             logger.info("网络已空闲")
             return self
         except Exception as e:
-            logger.warning(f"等待网络空闲超时: {str(e)}")
+            logger.warning("等待网络空闲超时: %s", e)
             return self
 
     # ==================== 增强功能方法 ====================
@@ -667,7 +970,7 @@ class BasePage(ABC):
         Args:
             condition_func: 条件检查函数，返回True时停止等待
             timeout: 超时时间(毫秒)
-            poll_interval: 轮询间隔(秒)
+            poll_interval: 最大轮询间隔(秒)，从 25ms 起指数退避至该值
             error_message: 超时错误消息
 
         Returns:
@@ -677,7 +980,8 @@ class BasePage(ABC):
             TimeoutError: 等待超时
         """
         timeout = timeout or self.timeout
-        start_time = time.time() * 1000
+        deadline_ns = time.monotonic_ns() + timeout * 1_000_000
+        interval = INITIAL_POLL_INTERVAL
 
         while True:
             try:
@@ -685,14 +989,15 @@ class BasePage(ABC):
                     logger.info("等待条件已满足")
                     return self
             except Exception as e:
-                logger.error(f"条件检查异常: {str(e)}")
+                logger.error("条件检查异常: %s", e)
 
-            current_time = time.time() * 1000
-            if current_time - start_time >= timeout:
-                logger.warning(f"等待条件超时: {error_message}")
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                logger.warning("等待条件超时: %s", error_message)
                 raise TimeoutError(f"{error_message} (超时: {timeout}ms)")
 
-            time.sleep(poll_interval)
+            time.sleep(min(interval, remaining_ns / 1e9))
+            interval = min(interval * 2, poll_interval)
 
     def get_elements(self, selector: SelectorType, timeout: Optional[int] = None) -> List[Locator]:
         """
@@ -708,15 +1013,19 @@ class BasePage(ABC):
         timeout = timeout or self.timeout
         try:
             locator = self._resolve_selector(selector)
-            # 等待至少一个元素出现
-            locator.first.wait_for(state="attached", timeout=timeout)
-            elements = locator.all()
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"找到 {len(elements)} 个元素: {selector_desc}")
+            # 元素已存在时一次 count 即可；否则等待至少一个元素出现后再计数
+            count = locator.count()
+            if count == 0:
+                locator.first.wait_for(state="attached", timeout=timeout)
+                count = locator.count()
+            # nth 只在客户端构造定位器，不产生额外往返
+            elements = [locator.nth(i) for i in range(count)]
+            selector_desc = self._describe(selector)
+            logger.info("找到 %s 个元素: %s", len(elements), selector_desc)
             return elements
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"获取元素列表失败 {selector_desc}: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("获取元素列表失败 %s: %s", selector_desc, e)
             return []
 
     def get_elements_count(self, selector: SelectorType, timeout: Optional[int] = None) -> int:
@@ -735,12 +1044,12 @@ class BasePage(ABC):
             locator = self._resolve_selector(selector)
             locator.wait_for(timeout=timeout)
             count = locator.count()
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"元素数量 {selector_desc}: {count}")
+            selector_desc = self._describe(selector)
+            logger.info("元素数量 %s: %s", selector_desc, count)
             return count
         except Exception as e:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.error(f"获取元素数量失败 {selector_desc}: {str(e)}")
+            selector_desc = self._describe(selector)
+            logger.error("获取元素数量失败 %s: %s", selector_desc, e)
             return 0
         # 未使用局部变量 'timeout' 的值
 
@@ -761,7 +1070,7 @@ class BasePage(ABC):
         def check_count():
             return self.get_elements_count(selector) == expected_count
 
-        selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
+        selector_desc = self._describe(selector)
         self.wait_for_condition(
             check_count,
             timeout,
@@ -787,14 +1096,14 @@ class BasePage(ABC):
             source = self.get_element(source_selector, timeout)
             target = self.get_element(target_selector, timeout)
 
-            source_desc = str(source_selector) if isinstance(source_selector, str) else f"Locator({source_selector})"
-            target_desc = str(target_selector) if isinstance(target_selector, str) else f"Locator({target_selector})"
-            logger.info(f"拖拽元素: {source_desc} -> {target_desc}")
+            source_desc = self._describe(source_selector)
+            target_desc = self._describe(target_selector)
+            logger.info("拖拽元素: %s -> %s", source_desc, target_desc)
             source.drag_to(target)
 
             return self
         except Exception as e:
-            logger.error(f"拖拽操作失败: {str(e)}")
+            logger.error("拖拽操作失败: %s", e)
             raise
 
     def upload_file(self, selector: SelectorType, file_path: str, timeout: Optional[int] = None) -> 'BasePage':
@@ -811,14 +1120,14 @@ class BasePage(ABC):
         """
         timeout = timeout or self.timeout
         try:
-            selector_desc = str(selector) if isinstance(selector, str) else f"Locator({selector})"
-            logger.info(f"上传文件: {file_path} 到 {selector_desc}")
+            selector_desc = self._describe(selector)
+            logger.info("上传文件: %s 到 %s", file_path, selector_desc)
             element = self.get_element(selector, timeout)
             element.set_input_files(file_path)
 
             return self
         except Exception as e:
-            logger.error(f"文件上传失败: {str(e)}")
+            logger.error("文件上传失败: %s", e)
             raise
 
     def switch_to_frame(self, frame_selector: SelectorType, timeout: Optional[int] = None) -> FrameLocator:
@@ -845,14 +1154,15 @@ class BasePage(ABC):
                 selector_str = str(frame_selector)
 
             selector_desc = selector_str
-            logger.info(f"切换到iframe: {selector_desc}")
+            logger.info("切换到iframe: %s", selector_desc)
 
             # 使用page.frame_locator来获取frame
             frame_locator = self.page.frame_locator(selector_str)
+            self.clear_locator_cache()
             return frame_locator
 
         except Exception as e:
-            logger.error(f"切换iframe失败: {str(e)}")
+            logger.error("切换iframe失败: %s", e)
             raise
 
     def get_page_source(self) -> str:
@@ -864,10 +1174,10 @@ class BasePage(ABC):
         """
         try:
             source = self.page.content()
-            logger.info(f"获取页面源码，长度: {len(source)}")
+            logger.info("获取页面源码，长度: %s", len(source))
             return source
         except Exception as e:
-            logger.error(f"获取页面源码失败: {str(e)}")
+            logger.error("获取页面源码失败: %s", e)
             return ""
 
     def clear_cookies(self) -> 'BasePage':
@@ -879,14 +1189,15 @@ class BasePage(ABC):
         """
         try:
             logger.info("清除所有cookies")
+            self._pending_cookies.clear()
             self.page.context.clear_cookies()
             return self
         except Exception as e:
-            logger.error(f"清除cookies失败: {str(e)}")
+            logger.error("清除cookies失败: %s", e)
             return self
 
     def set_cookie(self, name: str, value: str, domain: Optional[str] = None,
-                   path: str = "/", expires: Optional[int] = None) -> 'BasePage':
+                   path: str = "/", expires: Optional[int] = None, defer: bool = False) -> 'BasePage':
         """
         设置cookie
 
@@ -896,6 +1207,7 @@ class BasePage(ABC):
             domain: 域名
             path: 路径
             expires: 过期时间(时间戳)
+            defer: 是否暂存，待 flush_cookies()/navigate() 时与其他 cookie 一并写入
 
         Returns:
             页面实例
@@ -912,13 +1224,48 @@ class BasePage(ABC):
             if expires:
                 cookie_data['expires'] = expires
 
-            logger.info(f"设置cookie: {name}={value}")
+            if defer:
+                self._pending_cookies.append(cookie_data)
+                logger.info("暂存cookie: %s=%s", name, value)
+                return self
+            logger.info("设置cookie: %s=%s", name, value)
             self.page.context.add_cookies([cookie_data])  # type: ignore[list-item]
             return self
         except Exception as e:
-            logger.error(f"设置cookie失败: {str(e)}")
+            logger.error("设置cookie失败: %s", e)
             return self
 
+    def set_cookies(self, cookies: List[Dict[str, Any]]) -> 'BasePage':
+        """
+        批量设置cookie，只产生一次浏览器调用
+
+        Args:
+            cookies: cookie字典列表，字段同 BrowserContext.add_cookies
+
+        Returns:
+            页面实例
+        """
+        try:
+            if cookies:
+                self.page.context.add_cookies(cookies)  # type: ignore[arg-type]
+                logger.info("批量设置 %s 个cookie", len(cookies))
+            return self
+        except Exception as e:
+            logger.error("批量设置cookie失败: %s", e)
+            return self
+
+    def flush_cookies(self) -> 'BasePage':
+        """
+        写入 set_cookie(defer=True) 暂存的全部 cookie
+
+        Returns:
+            页面实例
+        """
+        if self._pending_cookies:
+            pending, self._pending_cookies = self._pending_cookies, []
+            self.set_cookies(pending)
+        return self
+
     def get_cookies(self) -> List[Cookie]:
         """
         获取所有cookies
@@ -928,10 +1275,10 @@ class BasePage(ABC):
         """
         try:
             cookies = self.page.context.cookies()
-            logger.info(f"获取到 {len(cookies)} 个cookies")
+            logger.info("获取到 %s 个cookies", len(cookies))
             return cookies
         except Exception as e:
-            logger.error(f"获取cookies失败: {str(e)}")
+            logger.error("获取cookies失败: %s", e)
             return []
 
     def set_viewport_size(self, width: int, height: int) -> 'BasePage':
@@ -946,11 +1293,13 @@ class BasePage(ABC):
             页面实例
         """
         try:
-            logger.info(f"设置视口大小: {width}x{height}")
-            self.page.set_viewport_size({"width": width, "height": height})
+            logger.info("设置视口大小: %sx%s", width, height)
+            viewport = {"width": width, "height": height}
+            self.page.set_viewport_size(viewport)
+            self._cached_viewport = viewport
             return self
         except Exception as e:
-            logger.error(f"设置视口大小失败: {str(e)}")
+            logger.error("设置视口大小失败: %s", e)
             return self
 
     def get_viewport_size(self) -> Dict[str, int]:
@@ -961,11 +1310,13 @@ class BasePage(ABC):
             视口大小字典 {'width': int, 'height': int}
         """
         try:
-            viewport = self.page.viewport_size
-            logger.info(f"当前视口大小: {viewport}")
+            viewport = self._cached_viewport
+            if viewport is None:
+                viewport = self._cached_viewport = self.page.viewport_size
+            logger.info("当前视口大小: %s", viewport)
             return viewport or {'width': 0, 'height': 0}
         except Exception as e:
-            logger.error(f"获取视口大小失败: {str(e)}")
+            logger.error("获取视口大小失败: %s", e)
             return {'width': 0, 'height': 0}
 
     def click_and_wait_for_new_tab(self, selector: SelectorType, timeout: Optional[int] = None) -> Page:
@@ -984,7 +1335,7 @@ class BasePage(ABC):
             Exception: 点击操作失败
         """
         timeout = timeout or self.timeout
-        logger.info(f"点击并等待新标签页 {str(selector)}")
+        logger.info("点击并等待新标签页 %s", selector)
 
         try:
             # 监听新页面事件
@@ -998,11 +1349,11 @@ class BasePage(ABC):
             # 等待新页面加载完成
             new_page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
-            logger.info(f"成功打开新标签页: {new_page.url}")
+            logger.info("成功打开新标签页: %s", new_page.url)
             return new_page
 
         except Exception as e:
-            logger.error(f"点击并等待新标签页失败: {str(e)}")
+            logger.error("点击并等待新标签页失败: %s", e)
             raise
 
     def switch_to_new_tab(self, action_callback: Callable[[], None], timeout: Optional[int] = None) -> Page:
@@ -1023,7 +1374,7 @@ class BasePage(ABC):
             )
         """
         timeout = timeout or self.timeout
-        logger.info(f"执行操作并切换到新标签页 {str(action_callback)}")
+        logger.info("执行操作并切换到新标签页 %s", action_callback)
 
         try:
             # 监听新页面事件
@@ -1037,13 +1388,17 @@ class BasePage(ABC):
             # 等待新页面加载完成
             new_page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
-            logger.info(f"成功切换到新标签页: {new_page.url}")
+            logger.info("成功切换到新标签页: %s", new_page.url)
             return new_page
 
         except Exception as e:
-            logger.error(f"切换到新标签页失败: {str(e)}")
+            logger.error("切换到新标签页失败: %s", e)
             raise
 
+    def _pages(self) -> List[Page]:
+        """当前浏览器上下文中的所有页面（不记录日志）"""
+        return self.page.context.pages
+
     def get_all_pages(self) -> List[Page]:
         """
         获取当前浏览器上下文中的所有页面
@@ -1053,12 +1408,12 @@ class BasePage(ABC):
         """
         try:
             pages = self.page.context.pages
-            logger.info(f"当前共有 {len(pages)} 个页面")
+            logger.info("当前共有 %s 个页面", len(pages))
             for i, page in enumerate(pages):
-                logger.info(f"  页面 {i}: {page.url}")
+                logger.info("  页面 %s: %s", i, page.url)
             return pages
         except Exception as e:
-            logger.error(f"获取所有页面失败: {str(e)}")
+            logger.error("获取所有页面失败: %s", e)
             return []
 
     def switch_to_page_by_url(self, url_pattern: str) -> Optional[Page]:
@@ -1072,17 +1427,27 @@ class BasePage(ABC):
             匹配的页面对象，如果未找到则返回None
         """
         try:
-            pages = self.get_all_pages()
-            for page in pages:
-                if url_pattern in page.url or fnmatch.fnmatch(page.url, url_pattern):
-                    logger.info(f"切换到页面: {page.url}")
+            entries = [(page.url, page) for page in self._pages()]
+            # 精确匹配走字典查找；同一 URL 多个页面时保留最早打开的
+            by_url: Dict[str, Page] = {}
+            for page_url, page in entries:
+                by_url.setdefault(page_url, page)
+            page = by_url.get(url_pattern)
+            if page is not None:
+                logger.info("切换到页面: %s", url_pattern)
+                return page
+
+            matches = _url_matcher(url_pattern)
+            for page_url, page in entries:
+                if matches(page_url):
+                    logger.info("切换到页面: %s", page_url)
                     return page
 
-            logger.warning(f"未找到匹配URL模式的页面: {url_pattern}")
+            logger.warning("未找到匹配URL模式的页面: %s", url_pattern)
             return None
 
         except Exception as e:
-            logger.error(f"切换页面失败: {str(e)}")
+            logger.error("切换页面失败: %s", e)
             return None
 
     def switch_to_page_by_title(self, title_pattern: str) -> Optional[Page]:
@@ -1096,20 +1461,33 @@ class BasePage(ABC):
             匹配的页面对象，如果未找到则返回None
         """
         try:
-            pages = self.get_all_pages()
+            pages = self._pages()
             for page in pages:
-                page_title = page.title()
+                # 当前页面的标题走导航失效的缓存，其余页面逐个读取
+                page_title = self.get_current_title() if page is self.page else page.title()
                 if title_pattern in page_title:
-                    logger.info(f"切换到页面: {page_title} ({page.url})")
+                    logger.info("切换到页面: %s (%s)", page_title, page.url)
                     return page
 
-            logger.warning(f"未找到匹配标题模式的页面: {title_pattern}")
+            logger.warning("未找到匹配标题模式的页面: %s", title_pattern)
             return None
 
         except Exception as e:
-            logger.error(f"根据标题切换页面失败: {str(e)}")
+            logger.error("根据标题切换页面失败: %s", e)
             return None
 
+    @staticmethod
+    def _safe_close(page: Page) -> bool:
+        """关闭页面并记录日志，返回是否关闭成功"""
+        page_url = page.url
+        try:
+            page.close()
+            logger.info("已关闭页面: %s", page_url)
+            return True
+        except Exception as e:
+            logger.error("关闭页面失败: %s | %s", page_url, e)
+            return False
+
     def close_other_pages(self, keep_current: bool = True) -> None:
         """
         关闭其他页面，只保留当前页面或指定页面
@@ -1118,23 +1496,14 @@ class BasePage(ABC):
             keep_current: 是否保留当前页面
         """
         try:
-            pages = self.get_all_pages()
+            pages = self._pages()
             current_page = self.page if keep_current else None
 
-            closed_count = 0
-            for page in pages:
-                if page != current_page:
-                    try:
-                        page.close()
-                        closed_count += 1
-                        logger.info(f"已关闭页面: {page.url}")
-                    except Exception as e:
-                        logger.error(f"关闭页面失败: {page.url} | {str(e)}")
-
-            logger.info(f"已关闭 {closed_count} 个页面")
+            closed_count = sum(self._safe_close(page) for page in pages if page is not current_page)
+            logger.info("已关闭 %s 个页面", closed_count)
 
         except Exception as e:
-            logger.error(f"关闭其他页面失败: {str(e)}")
+            logger.error("关闭其他页面失败: %s", e)
 
     def wait_for_new_page(self, timeout: Optional[int] = None) -> Page:
         """
@@ -1156,9 +1525,9 @@ class BasePage(ABC):
             new_page = new_page_info.value
             new_page.wait_for_load_state("domcontentloaded", timeout=timeout)
 
-            logger.info(f"检测到新页面: {new_page.url}")
+            logger.info("检测到新页面: %s", new_page.url)
             return new_page
 
         except Exception as e:
-            logger.warning(f"等待新页面超时: {str(e)}")
+            logger.warning("等待新页面超时: %s", e)
             raise
@@ -3,53 +3,143 @@
 基于Python unittest框架，提供Web UI自动化测试的基础功能
 统一接入项目日志系统
 """
+import functools
 import unittest
+import logging
 import traceback
 import time
-from typing import Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from playwright.sync_api import Page
 
-from core.browser_manager import BrowserManager
+from core.base_page import BasePage
+from core.browser_manager import BrowserManager, BrowserName
 from config.browser_config import browser_config
 from utils.cmbird_logger import logger, set_current_logger, clear_current_logger
-from utils.screenshot import ScreenshotHelper
-from utils.video import VideoRecorder
 from config.videos_config import videos_config
-screenshot_helper = ScreenshotHelper()
-video_recorder = VideoRecorder()
+
+if TYPE_CHECKING:
+    from utils.screenshot import ScreenshotHelper
+    from utils.video import VideoRecorder
+
+PageObjectT = TypeVar("PageObjectT", bound=BasePage)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_screenshot_helper() -> "ScreenshotHelper":
+    """首次有用例失败时才导入并创建截图工具"""
+    from utils.screenshot import ScreenshotHelper
+    return ScreenshotHelper()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_video_recorder() -> "VideoRecorder":
+    """启用录像后首次用到时才导入并创建视频工具"""
+    from utils.video import VideoRecorder
+    return VideoRecorder()
+
+
+@dataclass(frozen=True, slots=True)
+class BrowserSettings:
+    """由浏览器配置解析出的启动参数与超时，配置未变化时复用"""
+    browser_type: BrowserName
+    headless: bool
+    viewport: Optional[Mapping[str, int]]
+    no_viewport: bool
+    user_agent: Optional[str]
+    locale: str
+    timezone: str
+    extra_http_headers: Optional[Mapping[str, Any]]
+    ignore_https_errors: bool
+    slow_mo: int
+    args: Tuple[str, ...]
+    default_timeout: int
+    navigation_timeout: int
+    # 预先组装的 ensure_browser / new_context 关键字参数，初始化时直接展开
+    launch_kwargs: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+    context_kwargs: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 浏览器类型在此统一转为小写，之后按 BrowserName 字面量直接分派
+        object.__setattr__(self, "browser_type", self.browser_type.lower())
+        object.__setattr__(self, "launch_kwargs", MappingProxyType({
+            "browser_type": self.browser_type,
+            "headless": self.headless,
+            "slow_mo": self.slow_mo,
+            "args": list(self.args),
+        }))
+        object.__setattr__(self, "context_kwargs", MappingProxyType({
+            "viewport": dict(self.viewport) if self.viewport else None,
+            "no_viewport": self.no_viewport,
+            "user_agent": self.user_agent,
+            "locale": self.locale,
+            "timezone": self.timezone,
+            "extra_http_headers": dict(self.extra_http_headers) if self.extra_http_headers else None,
+            "ignore_https_errors": self.ignore_https_errors,
+        }))
+
+
+# (配置视图, 解析结果)；配置 set/reload 后视图对象会更换，据此判断是否需要重新解析
+_settings_cache: Optional[Tuple[Mapping[str, Any], BrowserSettings]] = None
+
+
+def get_browser_settings() -> BrowserSettings:
+    """获取当前浏览器配置对应的 BrowserSettings"""
+    global _settings_cache
+    view = browser_config.get_all_config()
+    if _settings_cache is not None and _settings_cache[0] is view:
+        return _settings_cache[1]
+    cfg = browser_config.get_browser_config()
+    timeouts = browser_config.get_timeout_config()
+    settings = BrowserSettings(
+        browser_type=cfg.get("type", "chromium"),
+        headless=cfg.get("headless", False),
+        viewport=cfg.get("viewport"),
+        no_viewport=cfg.get("no_viewport", False),
+        user_agent=cfg.get("user_agent"),
+        locale=cfg.get("locale", "zh-CN"),
+        timezone=cfg.get("timezone", "Asia/Shanghai"),
+        extra_http_headers=cfg.get("extra_http_headers"),
+        ignore_https_errors=cfg.get("ignore_https_errors", True),
+        slow_mo=cfg.get("slow_mo", 0),
+        args=tuple(cfg.get("args", [])),
+        default_timeout=timeouts.get("default", 10000),
+        navigation_timeout=timeouts.get("navigation", 30000),
+    )
+    _settings_cache = (view, settings)
+    return settings
 
 
 class BaseTest(unittest.TestCase):
     """测试基类"""
-    
+
+    # TestCase 自带 __dict__，这里只把每个用例都会写入的计时字段放进槽位
+    __slots__ = ("_test_start_ns",)
+
     # 类级别的浏览器管理器
     browser_manager: Optional[BrowserManager] = None
     page: Optional[Page] = None
 
+    # 页面对象缓存：按测试类隔离（Page 在同类测试间复用），每个页面对象类仅保留一个实例，
+    # Page 变化时重建，tearDownClass 中解除绑定并清空
+    _page_objects: Optional[Dict[type, BasePage]] = None
+
     # ---------- 私有工具方法 ----------
     def _init_browser_if_needed(self) -> None:
         """按需初始化浏览器与上下文，并设置默认超时。"""
         if not self.browser_manager:
             logger.debug("检测到未初始化的浏览器管理器，执行按需初始化")
-            self.__class__.browser_manager = BrowserManager()
-            browser_config_data = browser_config.get_browser_config()
-            self.__class__.page = self.browser_manager.start_browser(
-                browser_type=browser_config_data.get("type", "chromium"),
-                headless=browser_config_data.get("headless", False),
-                viewport=browser_config_data.get("viewport"),
-                no_viewport=browser_config_data.get("no_viewport", False),
-                user_agent=browser_config_data.get("user_agent"),
-                locale=browser_config_data.get("locale", "zh-CN"),
-                timezone=browser_config_data.get("timezone", "Asia/Shanghai"),
-                extra_http_headers=browser_config_data.get("extra_http_headers"),
-                ignore_https_errors=browser_config_data.get("ignore_https_errors", True),
-                slow_mo=browser_config_data.get("slow_mo", 0),
-                args=browser_config_data.get("args", [])
-            )
-            timeout_config = browser_config.get_timeout_config()
-            self.browser_manager.set_default_timeout(timeout_config.get("default", 10000))
-            self.browser_manager.set_default_navigation_timeout(timeout_config.get("navigation", 30000))
+            settings = get_browser_settings()
+            # 浏览器进程由浏览器池在测试类之间复用，每个测试类使用独立上下文
+            manager = BrowserManager()
+            manager.ensure_browser(**settings.launch_kwargs)
+            manager.new_context(**settings.context_kwargs)
+            manager.set_default_timeout(settings.default_timeout)
+            manager.set_default_navigation_timeout(settings.navigation_timeout)
+            self.__class__.browser_manager = manager
+            self.__class__.page = manager.new_page()
 
     def _init_page_for_test(self) -> None:
         """为当前测试方法准备独立页面（视频启用或页面已关闭时）。"""
@@ -61,21 +151,41 @@ class BaseTest(unittest.TestCase):
                     self.browser_manager.close_page(self.page)
                 except Exception as e:
                     logger.debug(f"关闭旧页面时出现异常: {str(e)}")
-                    logger.debug(traceback.format_exc())
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(traceback.format_exc())
             logger.debug("创建新页面用于当前测试")
             self.page = self.browser_manager.new_page()
             self.__class__.page = self.page
 
+    def get_page_object(self, page_cls: Type[PageObjectT]) -> PageObjectT:
+        """获取绑定当前页面的页面对象；同一 Page 复用已构建的实例。"""
+        cls = self.__class__
+        if cls.__dict__.get("_page_objects") is None:
+            cls._page_objects = {}
+        obj = cls._page_objects.get(page_cls)
+        if obj is None or obj.page is not self.page:
+            if obj is not None:
+                # 解除旧页面对象的监听，避免其随 Page 事件累积且无法回收
+                obj.detach()
+            obj = page_cls(self.page)
+            cls._page_objects[page_cls] = obj
+        return obj  # type: ignore[return-value]
+
     def _clear_storage_and_cookies(self) -> None:
         """清理本地存储与 Cookies，减少状态残留。"""
         try:
-            if self.page and (not self.page.is_closed()):
-                self.page.evaluate("localStorage.clear(); sessionStorage.clear();")
+            # 未发生导航的空白页没有可清理的存储，省去一次 evaluate
+            if self.page and (not self.page.is_closed()) and self.page.url != "about:blank":
+                # 单次调用清理两类存储；各自 try，避免无权限访问存储的页面（如 about:blank）中断后续 Cookies 清理
+                self.page.evaluate(
+                    "try { localStorage.clear() } catch (e) {} try { sessionStorage.clear() } catch (e) {}"
+                )
             if self.browser_manager and self.browser_manager.context:
                 self.browser_manager.context.clear_cookies()
         except Exception as e:
             logger.debug(f"清理存储或 Cookies 时出现异常: {str(e)}")
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
 
     def _select_page_for_failure_screenshot(self) -> Optional[Page]:
         """在失败截图时选择最可能相关的页面。
@@ -87,7 +197,8 @@ class BaseTest(unittest.TestCase):
                 pages = [p for p in self.browser_manager.get_all_pages() if p and not p.is_closed()]
             except Exception as e:
                 logger.debug(f"枚举页面时出现异常: {e}")
-                logger.debug(traceback.format_exc())
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(traceback.format_exc())
         elif self.page and not self.page.is_closed():
             pages = [self.page]
 
@@ -110,6 +221,20 @@ class BaseTest(unittest.TestCase):
         logger.debug(f"失败截图选择最新页面: {getattr(chosen, 'url', '未知URL')}")
         return chosen
 
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """关闭本测试类的浏览器上下文，浏览器进程留给后续测试类复用"""
+        page_objects = cls.__dict__.get("_page_objects")
+        if page_objects:
+            for obj in page_objects.values():
+                obj.detach()
+        cls._page_objects = None
+        if cls.browser_manager:
+            cls.browser_manager.close_context()
+        cls.browser_manager = None
+        cls.page = None
+        super().tearDownClass()
+
     def setUp(self) -> None:
         """
         测试方法级别的初始化
@@ -120,14 +245,15 @@ class BaseTest(unittest.TestCase):
             set_current_logger(getattr(self, "logger", None))
             logger.info(f"开始执行测试方法: {self._testMethodName}")
             # 记录测试开始时间
-            self._test_start_time = time.perf_counter()
+            self._test_start_ns = time.monotonic_ns()
             # 初始化浏览器与页面
             self._init_browser_if_needed()
             self._init_page_for_test()
             
         except Exception as e:
             logger.error(f"测试方法 {self._testMethodName} 初始化失败: {str(e)}")
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
             raise
     
     def tearDown(self) -> None:
@@ -137,40 +263,48 @@ class BaseTest(unittest.TestCase):
         """
         outcome = getattr(self, "_outcome", None)
         result = getattr(outcome, "result", None)
+        name = self._testMethodName
+        cls_name = self.__class__.__name__
         try:
             if not result:
                 clear_current_logger()
                 return
 
+            # 本用例的异常与断言失败只提取一次，供详情与摘要共用
+            errors, failures = self._own_failures(result)
+
             # 记录失败详情
-            self._record_failure_details(result)
+            self._record_failure_details(name, errors, failures)
 
-            # 捕获失败截图（只对主页面）
-            screenshot_helper.capture_on_failure(
-                page=self._select_page_for_failure_screenshot(),
-                class_name=self.__class__.__name__,
-                method_name=self._testMethodName,
-                result=result,
-                logger=logger,
-            )
+            # 捕获失败截图（只对主页面）；用例通过时不加载截图工具
+            if errors or failures:
+                _get_screenshot_helper().capture_on_failure(
+                    page=self._select_page_for_failure_screenshot(),
+                    class_name=cls_name,
+                    method_name=name,
+                    result=result,
+                    logger=logger,
+                )
 
             # 在页面关闭生成视频之前，先清理存储与 Cookies，避免参数化用例状态残留
             self._clear_storage_and_cookies()
 
-            # 多页视频统一处理（封装函数，避免深层嵌套）
-            self._process_videos_for_pages(result)
+            # 多页视频统一处理（封装函数，避免深层嵌套）；未启用录像时无需枚举页面
+            if videos_config.enabled():
+                self._process_videos_for_pages(result, name, cls_name)
 
             # 输出结果摘要
-            self._log_test_summary(result)
+            self._log_test_summary(name, bool(errors or failures))
         except Exception as e:
             # 防御性处理：不影响测试结果
-            logger.debug(f"tearDown 记录/处理失败信息时出现异常: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("tearDown 记录/处理失败信息时出现异常: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
         finally:
             # 清理当前上下文 logger
             clear_current_logger()
 
-    def _process_videos_for_pages(self, result) -> None:
+    def _process_videos_for_pages(self, result, name: str, cls_name: str) -> None:
         """遍历未关闭页面并按规则保存/丢弃视频，主页面无后缀，其他页面追加 __tabN"""
         pages = []
         if self.browser_manager:
@@ -180,57 +314,69 @@ class BaseTest(unittest.TestCase):
 
         # 调试信息（尽量不影响主流程）
         try:
-            logger.debug(f"tearDown 枚举到 {len(pages)} 个未关闭页面")
+            logger.debug("tearDown 枚举到 %s 个未关闭页面", len(pages))
             for i, pg in enumerate(pages, start=1):
-                logger.debug(f"  页面[{i}]: {getattr(pg, 'url', '未知URL')}")
+                logger.debug("  页面[%s]: %s", i, getattr(pg, 'url', '未知URL'))
         except Exception:
             pass
 
+        video_recorder = _get_video_recorder()
         non_main_index = 0
         for p in pages:
             if p is self.page:
-                method_tag = self._testMethodName
+                method_tag = name
             else:
                 non_main_index += 1
-                method_tag = f"{self._testMethodName}__tab{non_main_index}"
+                method_tag = f"{name}__tab{non_main_index}"
             video_recorder.handle_test_teardown(
                 page=p,
-                class_name=self.__class__.__name__,
+                class_name=cls_name,
                 method_name=method_tag,
                 result=result,
             )
 
-    def _record_failure_details(self, result) -> None:
+    def _own_failures(self, result) -> Tuple[List[str], List[str]]:
+        """
+        提取本测试用例的异常与断言失败文本
+
+        本用例的记录总是追加在 errors/failures 末尾，从尾部倒序读取到其他用例为止，
+        避免每个用例都扫描整个结果列表。subTest 失败以 _SubTest 记录，通过其 test_case 归属本用例。
+        """
+        def tail(entries) -> List[str]:
+            own: List[str] = []
+            for test, text in reversed(entries):
+                if test is not self and getattr(test, "test_case", None) is not self:
+                    break
+                if text:
+                    own.append(text)
+            own.reverse()
+            return own
+
+        return tail(getattr(result, "errors", [])), tail(getattr(result, "failures", []))
+
+    def _record_failure_details(self, name: str, errors: List[str], failures: List[str]) -> None:
         """
         将本测试用例的异常与断言失败完整文本写入 error 日志
         """
         # 错误（异常）
-        for test, err in list(getattr(result, "errors", [])):
-            if test is self and err:
-                logger.error(f"测试方法 {self._testMethodName} 异常失败:\n{err}")
+        for err in errors:
+            logger.error("测试方法 %s 异常失败:\n%s", name, err)
         # 断言失败
-        for test, fail in list(getattr(result, "failures", [])):
-            if test is self and fail:
-                logger.error(f"测试方法 {self._testMethodName} 断言失败:\n{fail}")
+        for fail in failures:
+            logger.error("测试方法 %s 断言失败:\n%s", name, fail)
 
-    def _log_test_summary(self, result) -> None:
+    def _log_test_summary(self, name: str, failed: bool) -> None:
         """
         输出本测试用例的结果摘要（通过/失败 + 耗时）
         """
-        start = getattr(self, "_test_start_time", None)
+        start = getattr(self, "_test_start_ns", None)
         duration_ms = None
         if start is not None:
-            duration_ms = int((time.perf_counter() - start) * 1000)
+            duration_ms = (time.monotonic_ns() - start) // 1_000_000
 
-        has_error = any(test is self and err for test, err in list(getattr(result, "errors", [])))
-        has_failure = any(test is self and fail for test, fail in list(getattr(result, "failures", [])))
-        status = "失败" if (has_error or has_failure) else "通过"
-
-        msg = f"测试方法 {self._testMethodName} 结果: {status}"
+        status = "失败" if failed else "通过"
+        log = logger.error if failed else logger.info
         if duration_ms is not None:
-            msg += f"，耗时 {duration_ms}ms"
-
-        if status == "通过":
-            logger.info(msg)
+            log("测试方法 %s 结果: %s，耗时 %sms", name, status, duration_ms)
         else:
-            logger.error(msg)
\ No newline at end of file
+            log("测试方法 %s 结果: %s", name, status)
\ No newline at end of file
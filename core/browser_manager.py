@@ -1,18 +1,198 @@
 """
 浏览器管理类
 负责浏览器的启动、关闭和上下文管理
+
+Playwright 与 Browser 由线程级浏览器池按（浏览器类型，启动参数）复用，
+BrowserManager 只持有自己的上下文与页面；浏览器进程在进程退出时统一关闭。
+Playwright 在首次启动浏览器时才导入，收集用例时导入本模块不加载 Playwright。
 """
-from typing import Optional, Dict, List
-from playwright.sync_api import Playwright, Browser, BrowserContext, Page, sync_playwright
+from __future__ import annotations
+
+import atexit
+import functools
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Literal, Mapping, Optional, Tuple, get_args
 from utils.cmbird_logger import logger
 from config.videos_config import videos_config
 import os
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Playwright, Browser, BrowserContext, BrowserType, Page
+
 # 使用 cmbird 日志代理（由 BaseTest 在运行时注册）
 
+BrowserName = Literal["chromium", "firefox", "webkit"]
+_BROWSER_NAMES = frozenset(get_args(BrowserName))
+
+
+class _BrowserPool(threading.local):
+    """
+    线程级浏览器池
+
+    Playwright 同步 API 的对象只能在创建它的线程中使用，因此池本身是线程局部的：
+    每个线程各自持有一个 Playwright，浏览器按（浏览器类型，启动参数）复用，无需加锁。
+    """
+
+    def __init__(self) -> None:
+        # threading.local 子类的 __init__ 在每个线程首次访问时执行
+        self.playwright: Optional[Playwright] = None
+        self.launchers: Dict[str, BrowserType] = {}
+        self.browsers: Dict[Tuple[str, str], Browser] = {}
+
+    def acquire(self,
+                browser_type: BrowserName,
+                launch_options: Dict[str, Any],
+                cdp_endpoint: Optional[str] = None) -> Tuple[Playwright, Browser]:
+        """
+        获取当前线程中与启动参数一致的浏览器，不存在或已断开时启动
+
+        指定 cdp_endpoint 时改为通过 CDP 连接已运行的 Chromium，多个工作进程共享同一浏览器进程，
+        启动参数不再生效；关闭时只断开连接，不结束远端浏览器。
+        """
+        if browser_type not in _BROWSER_NAMES:
+            # 兼容未规范化大小写的调用方（如直接读取配置的 type）
+            browser_type = browser_type.lower()
+        if cdp_endpoint:
+            key = ("cdp", cdp_endpoint)
+        else:
+            key = (browser_type, repr(sorted(launch_options.items())))
+        browser = self.browsers.get(key)
+        if self.playwright is not None and browser is not None and browser.is_connected():
+            return self.playwright, browser
+
+        if self.playwright is None:
+            from playwright.sync_api import sync_playwright
+            self.playwright = sync_playwright().start()
+            self.launchers = {
+                "chromium": self.playwright.chromium,
+                "firefox": self.playwright.firefox,
+                "webkit": self.playwright.webkit,
+            }
+
+        # 获取浏览器类型
+        browser_launcher = self.launchers.get(browser_type)
+        if browser_launcher is None:
+            raise ValueError(f"不支持的浏览器类型: {browser_type}")
+
+        if cdp_endpoint:
+            if browser_type != "chromium":
+                raise ValueError(f"CDP 连接仅支持 chromium，当前浏览器类型: {browser_type}")
+            browser = browser_launcher.connect_over_cdp(cdp_endpoint)
+            logger.debug(f"已通过 CDP 连接浏览器: {cdp_endpoint}")
+        else:
+            browser = browser_launcher.launch(**launch_options)
+            logger.debug(f"浏览器 {browser_type} 启动成功")
+        self.browsers[key] = browser
+        return self.playwright, browser
+
+    def shutdown(self) -> None:
+        """关闭当前线程启动的所有浏览器并停止其 Playwright"""
+        browsers, self.browsers = list(self.browsers.values()), {}
+        playwright, self.playwright = self.playwright, None
+        self.launchers = {}
+        for browser in browsers:
+            try:
+                browser.close()
+            except Exception as e:
+                logger.error(f"关闭浏览器失败: {str(e)}")
+        if playwright is not None:
+            try:
+                playwright.stop()
+                logger.debug("Playwright 停止成功")
+            except Exception as e:
+                logger.error(f"停止 Playwright 失败: {str(e)}")
+
+
+_browser_pool = _BrowserPool()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_video_options() -> Dict[str, Any]:
+    """解析视频录制的上下文参数并创建目录；视频配置在进程内不变，只计算一次"""
+    options: Dict[str, Any] = {}
+    try:
+        if videos_config.enabled():
+            project_root = os.path.dirname(os.path.dirname(__file__))
+            vdir = videos_config.directory()
+            record_dir = vdir if os.path.isabs(vdir) else os.path.join(project_root, vdir)
+            os.makedirs(record_dir, exist_ok=True)
+            options["record_video_dir"] = record_dir
+            size = videos_config.size()
+            if isinstance(size, dict) and "width" in size and "height" in size:
+                options["record_video_size"] = {
+                    "width": int(size["width"]),
+                    "height": int(size["height"]),
+                }
+    except Exception as e:
+        logger.warning(f"视频录制上下文配置失败，将不启用视频: {str(e)}")
+        options.clear()
+    return options
+
+
+@functools.lru_cache(maxsize=32)
+def _build_context_options(viewport: Optional[Tuple[Tuple[str, int], ...]],
+                           no_viewport: bool,
+                           user_agent: Optional[str],
+                           locale: str,
+                           timezone: str,
+                           extra_http_headers: Optional[Tuple[Tuple[str, Any], ...]],
+                           ignore_https_errors: bool) -> Mapping[str, Any]:
+    """组装 browser.new_context 参数（含视频录制参数），按参数缓存只读结果"""
+    optional = {
+        "user_agent": user_agent,
+        "extra_http_headers": dict(extra_http_headers) if extra_http_headers else None,
+    }
+    return MappingProxyType({
+        # 设置默认视口
+        "viewport": dict(viewport) if viewport is not None else {"width": 1920, "height": 1080},
+        "locale": locale,
+        "timezone_id": timezone,
+        "ignore_https_errors": ignore_https_errors,
+        "no_viewport": no_viewport,
+        **{k: v for k, v in optional.items() if v},
+        # 视频录制：根据配置启用上下文视频目录
+        **_resolve_video_options(),
+    })
+
+
+def context_options(viewport: Optional[Dict[str, int]] = None,
+                    no_viewport: bool = False,
+                    user_agent: Optional[str] = None,
+                    locale: str = "zh-CN",
+                    timezone: str = "Asia/Shanghai",
+                    extra_http_headers: Optional[Dict[str, Any]] = None,
+                    ignore_https_errors: bool = True) -> Mapping[str, Any]:
+    """
+    将 BrowserSettings.context_kwargs 形式的参数转换为 new_context 选项（含默认视口与视频录制）
+
+    同步、异步与并行执行统一经由此处组装上下文参数，返回只读映射。
+    """
+    # 相同参数的上下文选项只组装一次；字典参数转为元组以便作为缓存键
+    return _build_context_options(
+        tuple(viewport.items()) if viewport is not None else None,
+        bool(no_viewport),
+        user_agent,
+        locale,
+        timezone,
+        tuple(extra_http_headers.items()) if extra_http_headers else None,
+        ignore_https_errors,
+    )
+
+
+def shutdown_browsers() -> None:
+    """关闭当前线程的池化浏览器；主线程在进程退出时自动调用，工作线程需在退出前自行调用"""
+    _browser_pool.shutdown()
+
+
+atexit.register(shutdown_browsers)
+
 
 class BrowserManager:
     """浏览器管理类"""
+
+    # 具名登录态快照（storage_state），跨管理器、跨线程共享
+    _storage_states: ClassVar[Dict[str, Dict[str, Any]]] = {}
     
     def __init__(self):
         """初始化浏览器管理器"""
@@ -21,9 +201,11 @@ class BrowserManager:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self._is_started = False
+        # 最近一次创建上下文使用的参数，供 reset() 重建上下文
+        self._context_options: Optional[Mapping[str, Any]] = None
         
     def start_browser(self, 
-                     browser_type: str = "chromium",
+                     browser_type: BrowserName = "chromium",
                      headless: bool = False,
                      viewport: Optional[Dict[str, int]] = None,
                      no_viewport: bool = False,
@@ -34,6 +216,8 @@ class BrowserManager:
                      ignore_https_errors: bool = True,
                      slow_mo: int = 0,
                      args: Optional[List[str]] = None,
+                     storage_state_name: Optional[str] = None,
+                     cdp_endpoint: Optional[str] = None,
                      **kwargs) -> Page:
         """
         启动浏览器并创建页面
@@ -50,6 +234,8 @@ class BrowserManager:
             ignore_https_errors: 是否忽略HTTPS错误
             slow_mo: 操作延迟时间(毫秒)
             args: 浏览器启动参数
+            storage_state_name: 登录态快照名称（见 capture_storage_state），指定时以该快照创建上下文
+            cdp_endpoint: CDP 地址（如 http://localhost:9222），指定时连接已运行的 Chromium 而不是启动新浏览器
             **kwargs: 其他浏览器选项
             
         Returns:
@@ -57,80 +243,23 @@ class BrowserManager:
         """
         try:
             if self._is_started:
-                logger.warning("浏览器已经启动，将先关闭现有浏览器")
-                self.close_browser()
-                
-            # 启动 Playwright
-            self.playwright = sync_playwright().start()
-            
-            # 获取浏览器类型
-            if browser_type.lower() == "chromium":
-                browser_launcher = self.playwright.chromium
-            elif browser_type.lower() == "firefox":
-                browser_launcher = self.playwright.firefox
-            elif browser_type.lower() == "webkit":
-                browser_launcher = self.playwright.webkit
-            else:
-                raise ValueError(f"不支持的浏览器类型: {browser_type}")
-            
-            # 设置默认视口
-            if viewport is None:
-                viewport = {"width": 1920, "height": 1080}
+                # 浏览器由浏览器池复用，只需关闭现有上下文
+                logger.warning("浏览器已经启动，将先关闭现有上下文")
+                self.close_context()
 
-            # 禁用视口 (全屏模式)
-            if no_viewport is None:
-                no_viewport = False
-                
-            # 设置默认启动参数
-            if args is None:
-                args = []
-                
-            # 启动浏览器
-            browser_options = {
-                "headless": headless,
-                "slow_mo": slow_mo,
-                "args": args,
-                **kwargs
-            }
-            
-            self.browser = browser_launcher.launch(**browser_options)
-            logger.debug(f"浏览器 {browser_type} 启动成功")
-            
-            # 创建浏览器上下文
-            context_options = {
-                "viewport": viewport,
-                "locale": locale,
-                "timezone_id": timezone,
-                "ignore_https_errors": ignore_https_errors,
-                "no_viewport": no_viewport
-            }
-            
-            if user_agent:
-                context_options["user_agent"] = user_agent
-                
-            if extra_http_headers:
-                context_options["extra_http_headers"] = extra_http_headers
-                
-            # 视频录制：根据配置启用上下文视频目录
-            try:
-                if videos_config.enabled():
-                    project_root = os.path.dirname(os.path.dirname(__file__))
-                    vdir = videos_config.directory()
-                    record_dir = vdir if os.path.isabs(vdir) else os.path.join(project_root, vdir)
-                    os.makedirs(record_dir, exist_ok=True)
-                    context_options["record_video_dir"] = record_dir
-                    size = videos_config.size()
-                    if isinstance(size, dict) and "width" in size and "height" in size:
-                        context_options["record_video_size"] = {
-                            "width": int(size["width"]),
-                            "height": int(size["height"]),
-                        }
-            except Exception as e:
-                logger.warning(f"视频录制上下文配置失败，将不启用视频: {str(e)}")
+            self.ensure_browser(browser_type, headless=headless, slow_mo=slow_mo, args=args,
+                                cdp_endpoint=cdp_endpoint, **kwargs)
+            self.new_context(
+                viewport=viewport,
+                no_viewport=no_viewport,
+                user_agent=user_agent,
+                locale=locale,
+                timezone=timezone,
+                extra_http_headers=extra_http_headers,
+                ignore_https_errors=ignore_https_errors,
+                storage_state_name=storage_state_name,
+            )
 
-            self.context = self.browser.new_context(**context_options)
-            logger.debug("浏览器上下文创建成功")
-            
             # 创建页面
             self.page = self.context.new_page()
             logger.debug("页面创建成功")
@@ -140,8 +269,122 @@ class BrowserManager:
             
         except Exception as e:
             logger.error(f"启动浏览器失败: {str(e)}")
-            self.close_browser()
+            self.close_context()
             raise
+
+    def ensure_browser(self,
+                       browser_type: BrowserName = "chromium",
+                       headless: bool = False,
+                       slow_mo: int = 0,
+                       args: Optional[List[str]] = None,
+                       cdp_endpoint: Optional[str] = None,
+                       **kwargs) -> Browser:
+        """
+        从浏览器池获取浏览器；相同类型与启动参数的浏览器已启动时直接复用
+
+        Args:
+            browser_type: 浏览器类型 (chromium, firefox, webkit)
+            headless: 是否无头模式
+            slow_mo: 操作延迟时间(毫秒)
+            args: 浏览器启动参数
+            cdp_endpoint: CDP 地址，指定时连接已运行的 Chromium（各管理器仍使用独立上下文）
+            **kwargs: 其他浏览器选项
+
+        Returns:
+            Browser: 浏览器实例
+        """
+        # 设置默认启动参数
+        if args is None:
+            args = []
+
+        browser_options = {
+            "headless": headless,
+            "slow_mo": slow_mo,
+            "args": args,
+            **kwargs
+        }
+
+        self.playwright, self.browser = _browser_pool.acquire(browser_type, browser_options, cdp_endpoint)
+        return self.browser
+
+    def new_context(self,
+                    viewport: Optional[Dict[str, int]] = None,
+                    no_viewport: bool = False,
+                    user_agent: Optional[str] = None,
+                    locale: str = "zh-CN",
+                    timezone: str = "Asia/Shanghai",
+                    extra_http_headers: Optional[Dict[str, str | int | bool]] = None,
+                    ignore_https_errors: bool = True,
+                    storage_state_name: Optional[str] = None) -> BrowserContext:
+        """
+        在已启动的浏览器上创建新的上下文（先关闭当前上下文）
+
+        Args:
+            viewport: 视口大小 {"width": 1920, "height": 1080}
+            no_viewport: 是否禁用视口 (全屏模式)
+            user_agent: 用户代理
+            locale: 语言环境
+            timezone: 时区
+            extra_http_headers: 额外的HTTP头
+            ignore_https_errors: 是否忽略HTTPS错误
+            storage_state_name: 登录态快照名称，指定时以该快照的 Cookie 与存储创建上下文
+
+        Returns:
+            BrowserContext: 浏览器上下文
+        """
+        if not self.browser:
+            raise RuntimeError("浏览器未启动，请先调用 ensure_browser")
+        if self.context:
+            self.close_context()
+
+        options: Mapping[str, Any] = context_options(
+            viewport, no_viewport, user_agent, locale, timezone, extra_http_headers, ignore_https_errors,
+        )
+
+        if storage_state_name:
+            storage_state = self._storage_states.get(storage_state_name)
+            if storage_state is None:
+                raise ValueError(f"未找到登录态快照: {storage_state_name}")
+            # 缓存的选项只读，需要追加参数时复制一份
+            options = {**options, "storage_state": storage_state}
+
+        self.context = self.browser.new_context(**options)
+        self._context_options = options
+        self._is_started = True
+        logger.debug("浏览器上下文创建成功")
+        return self.context
+
+    def capture_storage_state(self, name: str) -> Dict[str, Any]:
+        """
+        保存当前上下文的 Cookie 与 localStorage 为具名快照，后续上下文可通过 storage_state_name 复用
+
+        Args:
+            name: 快照名称
+
+        Returns:
+            Dict[str, Any]: 登录态快照
+        """
+        if not self.context:
+            raise RuntimeError("浏览器上下文未初始化，请先启动浏览器")
+        storage_state = self.context.storage_state()
+        self._storage_states[name] = storage_state
+        logger.debug(f"已保存登录态快照: {name}")
+        return storage_state
+
+    def reset(self) -> BrowserContext:
+        """
+        以上次的参数重建上下文，清空 Cookie 与存储等状态，浏览器进程保持不变
+
+        Returns:
+            BrowserContext: 新的浏览器上下文
+        """
+        if not self.browser or self._context_options is None:
+            raise RuntimeError("浏览器上下文未初始化，请先启动浏览器")
+        self.close_context()
+        self.context = self.browser.new_context(**self._context_options)
+        self._is_started = True
+        logger.debug("浏览器上下文已重置")
+        return self.context
     
     def new_page(self) -> Page:
         """
@@ -152,11 +395,11 @@ class BrowserManager:
         """
         if not self.context:
             raise RuntimeError("浏览器上下文未初始化，请先启动浏览器")
-            
+
         page = self.context.new_page()
         logger.debug("创建新页面成功")
         return page
-    
+
     def close_page(self, page: Optional[Page] = None) -> None:
         """
         关闭页面
@@ -187,26 +430,19 @@ class BrowserManager:
                 logger.debug("浏览器上下文关闭成功")
         except Exception as e:
             logger.error(f"关闭浏览器上下文失败: {str(e)}")
+        finally:
+            self._is_started = False
     
     def close_browser(self) -> None:
-        """关闭浏览器"""
-        try:
-            if self.browser:
-                self.browser.close()
-                self.browser = None
-                self.context = None
-                self.page = None
-                logger.debug("浏览器关闭成功")
-                
-            if self.playwright:
-                self.playwright.stop()
-                self.playwright = None
-                logger.debug("Playwright 停止成功")
-                
-            self._is_started = False
-            
-        except Exception as e:
-            logger.error(f"关闭浏览器失败: {str(e)}")
+        """关闭上下文并释放对池化浏览器的引用；浏览器进程由 shutdown_browsers 统一关闭"""
+        self.close_context()
+        self.browser = None
+        self.playwright = None
+
+    def shutdown(self) -> None:
+        """释放本管理器并关闭当前线程的池化浏览器，用于进程或工作线程退出前"""
+        self.close_browser()
+        shutdown_browsers()
     
     def get_current_page(self) -> Optional[Page]:
         """
@@ -249,7 +485,7 @@ class BrowserManager:
     
     def is_browser_started(self) -> bool:
         """
-        检查浏览器是否已启动
+        检查浏览器是否已启动（即当前持有可用的上下文）
         
         Returns:
             bool: 浏览器是否已启动
@@ -283,5 +519,5 @@ class BrowserManager:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """上下文管理器出口"""
-        self.close_browser()
\ No newline at end of file
+        """上下文管理器出口：只关闭上下文，浏览器留给后续复用"""
+        self.close_context()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+并行执行器
+将互不依赖的用例函数分发到多个工作线程，每个用例获得独立的 BrowserContext。
+
+Playwright 同步 API 的对象只能在创建它的线程中使用，因此每个工作线程从浏览器池
+获取本线程的 Playwright 与浏览器，并在本线程内依次为分到的用例创建、关闭上下文。
+页面对象的 Locator 缓存保存在 BasePage 实例上，各用例互不共享。
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+from playwright.sync_api import BrowserContext
+
+from core.base_test import get_browser_settings
+from core.browser_manager import BrowserManager
+from utils.cmbird_logger import logger
+
+TestFactory = Callable[[BrowserContext], None]
+
+
+def _run_chunk(factories: Sequence[TestFactory]) -> List[Optional[BaseException]]:
+    """在当前线程启动浏览器，逐个为用例创建独立上下文并执行"""
+    settings = get_browser_settings()
+    manager = BrowserManager()
+    try:
+        manager.ensure_browser(**settings.launch_kwargs)
+    except Exception as e:
+        # 浏览器未能启动，本组用例全部记为失败
+        manager.shutdown()
+        return [e] * len(factories)
+
+    errors: List[Optional[BaseException]] = []
+    try:
+        for factory in factories:
+            # 与串行执行的 BaseTest 使用同一套上下文参数（视口、请求头、视频录制等）
+            context = manager.new_context(**settings.context_kwargs)
+            manager.set_default_timeout(settings.default_timeout)
+            manager.set_default_navigation_timeout(settings.navigation_timeout)
+            try:
+                factory(context)
+                errors.append(None)
+            except Exception as e:
+                logger.error(f"并行用例执行失败: {getattr(factory, '__name__', factory)} | 错误: {str(e)}")
+                errors.append(e)
+            finally:
+                manager.close_context()
+    finally:
+        # 池化浏览器按线程归属，工作线程退出前关闭本线程启动的浏览器
+        manager.shutdown()
+    return errors
+
+
+def run_parallel(test_factories: List[TestFactory], workers: int = 2) -> List[Optional[BaseException]]:
+    """
+    并行执行用例函数
+
+    Args:
+        test_factories: 用例函数列表，每个函数接收独立的 BrowserContext，
+            自行 new_page() 并构造页面对象
+        workers: 工作线程数（即同时运行的浏览器数）
+
+    Returns:
+        List[Optional[BaseException]]: 与 test_factories 顺序一致，成功为 None，失败为异常
+    """
+    if not test_factories:
+        return []
+    workers = max(1, min(workers, len(test_factories)))
+    # 轮转分组，保持各线程负载接近
+    chunks = [test_factories[i::workers] for i in range(workers)]
+
+    results: List[Optional[BaseException]] = [None] * len(test_factories)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for offset, errors in enumerate(executor.map(_run_chunk, chunks)):
+            for j, error in enumerate(errors):
+                results[offset + j * workers] = error
+    failed = sum(1 for e in results if e is not None)
+    logger.info(f"并行执行完成: 共 {len(results)} 个，失败 {failed} 个")
+    return results
@@ -0,0 +1,156 @@
+"""
+测试编排器
+按共享状态扫描结果将测试模块划分为可并行（INDEPENDENT）与需串行（SHARED）两组：
+- INDEPENDENT 模块在独立工作进程中执行，每个进程由 BaseTest 按需启动自己的浏览器
+- SHARED 模块（源码中出现固定端口、临时路径、数据库写入等共享资源特征）在当前进程串行执行
+
+环境变量 SW_TEST_OPTIMIZER=false 可关闭并行，全部串行执行；
+命令行参数 --affected 只执行依赖链上有改动的模块（见 core.test_selector）。
+"""
+import fnmatch
+import importlib.util
+import os
+import re
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Pattern, Tuple
+
+from utils.cmbird_logger import logger
+
+# 共享状态特征：命中任意一条即视为 SHARED
+SHARED_STATE_PATTERNS: Tuple[Pattern[str], ...] = (
+    re.compile(r"\.bind\(\s*\(|socket\.socket\("),                   # 自行监听端口
+    re.compile(r"tempfile\.|['\"]/tmp/"),                            # 临时文件/目录
+    re.compile(r"sqlite3|\.execute\(|\bINSERT\s+INTO\b|\bDELETE\s+FROM\b", re.IGNORECASE),  # 数据库写入
+    re.compile(r"os\.environ\[[^\]]+\]\s*=|os\.putenv\("),           # 修改进程环境
+    re.compile(r"open\([^)]*['\"][wa]b?\+?['\"]"),                   # 写文件
+    re.compile(r"storage_state\s*="),                                # 共享登录态文件
+)
+
+MIN_WORKERS = 2
+MAX_WORKERS = 8
+
+
+class CaseOutcome(NamedTuple):
+    """单个测试模块的执行结果"""
+    name: str
+    tests_run: int
+    failures: int
+    errors: int
+
+    @property
+    def ok(self) -> bool:
+        return self.failures == 0 and self.errors == 0
+
+
+def optimizer_enabled() -> bool:
+    """是否启用并行编排（SW_TEST_OPTIMIZER=false/0/no/off 时关闭）"""
+    return os.getenv("SW_TEST_OPTIMIZER", "true").lower() not in ("false", "0", "no", "off")
+
+
+def default_workers() -> int:
+    """工作进程数：CPU 核数的 75%，限制在 [2, 8]"""
+    cpus = os.cpu_count() or MIN_WORKERS
+    return max(MIN_WORKERS, min(MAX_WORKERS, int(cpus * 0.75)))
+
+
+def is_shared_state(module_name: str) -> bool:
+    """扫描模块源码，判断是否存在共享状态特征；源码不可读时保守视为 SHARED。"""
+    try:
+        spec = importlib.util.find_spec(module_name)
+        origin = spec.origin if spec else None
+        if not origin or not origin.endswith(".py"):
+            return True
+        with open(origin, "r", encoding="utf-8") as f:
+            source = f.read()
+    except (ImportError, OSError, ValueError):
+        return True
+    return any(p.search(source) for p in SHARED_STATE_PATTERNS)
+
+
+def partition_cases(cases: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """
+    划分测试模块
+
+    Returns:
+        (independent, shared) 两个模块名列表
+    """
+    independent: List[str] = []
+    shared: List[str] = []
+    for name in cases:
+        (shared if is_shared_state(name) else independent).append(name)
+    return independent, shared
+
+
+def _run_case(module_name: str) -> CaseOutcome:
+    """在当前进程中执行单个测试模块（也作为工作进程入口）"""
+    suite = unittest.defaultTestLoader.loadTestsFromName(module_name)
+    result = unittest.TextTestRunner(stream=sys.stderr, verbosity=1).run(suite)
+    return CaseOutcome(module_name, result.testsRun, len(result.failures), len(result.errors))
+
+
+def testopt_execute(cases: Iterable[str], workers: int = 0) -> Dict[str, CaseOutcome]:
+    """
+    编排执行测试模块
+
+    Args:
+        cases: 测试模块名（如 "testcases.login.test_demo_user_login"）
+        workers: 工作进程数，0 表示按 CPU 自动计算
+
+    Returns:
+        Dict[str, CaseOutcome]: 模块名 -> 执行结果
+    """
+    cases = list(cases)
+    if not optimizer_enabled():
+        logger.info("SW_TEST_OPTIMIZER 已关闭，全部串行执行")
+        return {name: _run_case(name) for name in cases}
+
+    independent, shared = partition_cases(cases)
+    logger.info(f"并行模块 {len(independent)} 个，串行模块 {len(shared)} 个")
+
+    outcomes: Dict[str, CaseOutcome] = {}
+    if independent:
+        max_workers = min(workers or default_workers(), len(independent))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for outcome in executor.map(_run_case, independent):
+                outcomes[outcome.name] = outcome
+    for name in shared:
+        outcomes[name] = _run_case(name)
+    return outcomes
+
+
+# 函数名以 test 开头，避免被 pytest 误收集为测试用例
+testopt_execute.__test__ = False  # type: ignore[attr-defined]
+
+
+def discover_case_modules(start_dir: str = "testcases", pattern: str = "test_*.py") -> List[str]:
+    """按 unittest 约定扫描目录，返回测试模块名列表"""
+    modules: List[str] = []
+    for root, _dirs, files in os.walk(start_dir):
+        for file in sorted(files):
+            if fnmatch.fnmatch(file, pattern):
+                rel = os.path.relpath(os.path.join(root, file[:-3]))
+                modules.append(rel.replace(os.sep, "."))
+    return sorted(modules)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    affected_only = "--affected" in args
+    explicit = [a for a in args if a != "--affected"]
+    targets = explicit or discover_case_modules()
+    if affected_only:
+        from core.test_selector import select_affected
+        targets = select_affected(targets)
+    results = testopt_execute(targets)
+    for outcome in results.values():
+        status = "通过" if outcome.ok else "失败"
+        print(f"{outcome.name}: {status} (运行 {outcome.tests_run}, 失败 {outcome.failures}, 异常 {outcome.errors})")
+    all_ok = all(o.ok for o in results.values())
+    # 只有覆盖全部用例的执行（完整执行，或对完整扫描结果做 --affected 选择）才能更新基准：
+    # 后者未选中的模块自上次通过后没有相关改动。手动指定模块或未执行任何模块时不记录。
+    if all_ok and not explicit and results:
+        from core.test_selector import record_green
+        record_green()
+    sys.exit(0 if all_ok else 1)
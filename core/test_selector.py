@@ -0,0 +1,185 @@
+"""
+受影响用例选择
+基于源码 import 关系构建文件依赖图，结合 git 变更列表，只选出依赖链上有改动的测试模块。
+
+- 变更列表相对上次全部通过的提交计算（记录在 .tessl/last_green），包含其后的提交、未提交改动与未跟踪文件
+- 每个文件的直接 import 按 mtime 缓存到 .tessl/test_graph.json，未修改的文件不重复解析
+- 任意 YAML 配置变更视为全局影响，选中全部用例
+- 没有上次通过的记录、非 git 仓库或 git 不可用时返回全部用例
+"""
+import ast
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from utils.cmbird_logger import logger
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+GRAPH_FILE = PROJECT_ROOT / ".tessl" / "test_graph.json"
+LAST_GREEN_FILE = PROJECT_ROOT / ".tessl" / "last_green"
+CONFIG_SUFFIXES = (".yaml", ".yml")
+
+
+def _module_to_path(module: str) -> Optional[str]:
+    """将模块名解析为项目内的相对文件路径，非项目模块返回 None"""
+    base = PROJECT_ROOT.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate.relative_to(PROJECT_ROOT).as_posix()
+    return None
+
+
+def _parse_imports(rel_path: str) -> List[str]:
+    """解析文件中 import 的项目内模块，返回相对路径列表"""
+    try:
+        tree = ast.parse((PROJECT_ROOT / rel_path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    found: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            # from pkg import mod 既可能导入模块，也可能导入属性，两者都尝试
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        for name in names:
+            path = _module_to_path(name)
+            if path and path != rel_path:
+                found.add(path)
+    return sorted(found)
+
+
+class DependencyGraph:
+    """按文件 mtime 缓存直接依赖的依赖图"""
+
+    def __init__(self, graph_file: Path = GRAPH_FILE):
+        self._graph_file = graph_file
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        try:
+            self._entries = json.loads(graph_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def direct_imports(self, rel_path: str) -> List[str]:
+        try:
+            mtime_ns = (PROJECT_ROOT / rel_path).stat().st_mtime_ns
+        except OSError:
+            return []
+        entry = self._entries.get(rel_path)
+        if entry is None or entry.get("mtime_ns") != mtime_ns:
+            entry = {"mtime_ns": mtime_ns, "imports": _parse_imports(rel_path)}
+            self._entries[rel_path] = entry
+            self._dirty = True
+        return entry["imports"]
+
+    def closure(self, rel_path: str) -> Set[str]:
+        """文件自身及其传递依赖"""
+        seen = {rel_path}
+        stack = [rel_path]
+        while stack:
+            for dep in self.direct_imports(stack.pop()):
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        return seen
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self._graph_file.parent.mkdir(parents=True, exist_ok=True)
+            self._graph_file.write_text(json.dumps(self._entries, indent=2, sort_keys=True), encoding="utf-8")
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"保存依赖图失败: {str(e)}")
+
+
+def _git(*args: str) -> Optional[str]:
+    """执行 git 命令返回标准输出；git 不可用或命令失败时返回 None"""
+    try:
+        return subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def last_green_commit() -> Optional[str]:
+    """上次全部用例通过时的提交；未记录时返回 None"""
+    try:
+        commit = LAST_GREEN_FILE.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return commit or None
+
+
+def record_green() -> None:
+    """记录当前 HEAD 为上次全部通过的提交，供下次选择受影响用例时作为对比基准"""
+    head = _git("rev-parse", "HEAD")
+    if not head:
+        return
+    try:
+        LAST_GREEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+        LAST_GREEN_FILE.write_text(head.strip() + "\n", encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"记录通过的提交失败: {str(e)}")
+
+
+def changed_files(base: str) -> Optional[Set[str]]:
+    """相对 base 提交有改动（含其后的提交与未提交改动）或未跟踪的文件；git 不可用或 base 不存在时返回 None"""
+    commands = (
+        ("diff", "--name-only", base),
+        ("ls-files", "--others", "--exclude-standard"),
+    )
+    changed: Set[str] = set()
+    for cmd in commands:
+        out = _git(*cmd)
+        if out is None:
+            return None
+        changed.update(line.strip() for line in out.splitlines() if line.strip())
+    return changed
+
+
+def select_affected(test_modules: Iterable[str], changed: Optional[Set[str]] = None) -> List[str]:
+    """
+    选出受改动影响的测试模块
+
+    Args:
+        test_modules: 测试模块名列表
+        changed: 改动文件相对路径集合，None 时从 git 获取（相对上次全部通过的提交）
+
+    Returns:
+        List[str]: 需要执行的测试模块名
+    """
+    test_modules = list(test_modules)
+    if changed is None:
+        base = last_green_commit()
+        if base is None:
+            logger.info("没有上次全部通过的提交记录，执行全部用例")
+            return test_modules
+        changed = changed_files(base)
+    if changed is None:
+        logger.warning("无法获取 git 变更列表，执行全部用例")
+        return test_modules
+    if any(path.endswith(CONFIG_SUFFIXES) for path in changed):
+        logger.info("检测到配置文件变更，执行全部用例")
+        return test_modules
+
+    graph = DependencyGraph()
+    selected = []
+    for module in test_modules:
+        path = _module_to_path(module)
+        if path is None or graph.closure(path) & changed:
+            selected.append(module)
+    graph.save()
+    return selected
+
+
+if __name__ == "__main__":
+    from core.test_orchestrator import discover_case_modules
+
+    for name in select_affected(sys.argv[1:] or discover_case_modules()):
+        print(name)
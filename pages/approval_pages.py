@@ -1,12 +1,64 @@
+import re
+import warnings
+
 from playwright.sync_api import Page, expect
-from typing import List, Dict
+from typing import ClassVar, List, Dict, Optional, Pattern, Union
 
 from core.base_page import BasePage
 
+# 待审批状态文本；审批处理完成的标志是状态徽标不再匹配该模式
+PENDING_STATUS = re.compile(r"待审批|pending", re.IGNORECASE)
+# 已批准状态文本
+APPROVED_STATUS = re.compile(r"已批准|approve", re.IGNORECASE)
+
+# 读取单个申请项的标题、类型、优先级、状态与提交时间；meta-item 只遍历一次，类型与提交时间按标签文本匹配
+_APPROVAL_ROW_JS = """
+(el, title) => {
+    const text = s => el.querySelector(s)?.textContent || '';
+    const meta = Array.from(el.querySelectorAll('.meta-item'), m => [
+        m.querySelector('.meta-label')?.textContent || '',
+        m.querySelector('.meta-value')?.textContent || '',
+    ]);
+    const metaValue = label => (meta.find(([l]) => l.includes(label)) || [])[1] || '';
+    return {
+        title: text(title),
+        type: metaValue('类型'),
+        priority: text('.priority-badge'),
+        status: text('.status-badge'),
+        submitter: '',  // 提交者信息不在当前HTML结构中
+        date: metaValue('提交时间'),
+    };
+}
+"""
+_ALL_APPROVAL_ROWS_JS = f"(items, title) => items.map(el => ({_APPROVAL_ROW_JS})(el, title))"
+
 
 class ApprovalCreatePage(BasePage):
     """审批申请创建页面对象类"""
-    
+
+    __slots__ = ()
+
+    # 表单元素
+    approval_form = "#approvalForm"
+    title_input = "#title"
+    type_select = "#type"
+    priority_selector = ".priority-selector"
+    # 优先级 -> 选项选择器，预先生成，未知优先级在点击前即报错
+    PRIORITY_SELECTORS: ClassVar[Dict[str, str]] = {
+        p: f".priority-option[data-priority='{p}']" for p in ("low", "medium", "high", "urgent")
+    }
+    description_textarea = "#description"
+    submit_button = "button[type='submit']"
+    cancel_button = "button[type='button']"
+
+    # 消息提示
+    success_message = ".success-message"
+    error_message = ".error-message"
+
+    # 页面导航
+    breadcrumb = ".breadcrumb"
+    back_to_dashboard = "a[href='dashboard.html']"
+
     @property
     def url(self) -> str:
         """页面URL"""
@@ -17,30 +69,9 @@ class ApprovalCreatePage(BasePage):
         """页面标题"""
         return "提交申请 - 测试系统"
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # 表单元素
-        self.approval_form = "#approvalForm"
-        self.title_input = "#title"
-        self.type_select = "#type"
-        self.priority_selector = ".priority-selector"
-        self.description_textarea = "#description"
-        self.submit_button = "button[type='submit']"
-        self.cancel_button = "button[type='button']"
-        
-        # 消息提示
-        self.success_message = ".success-message"
-        self.error_message = ".error-message"
-        
-        # 页面导航
-        self.breadcrumb = ".breadcrumb"
-        self.back_to_dashboard = "a[href='dashboard.html']"
-        
     def wait_for_approval_create_page_load(self):
         """等待审批创建页面加载完成"""
-        self.wait_for_element(self.approval_form)
-        self.wait_for_element(self.title_input)
+        self.expect_all_visible(self.approval_form, self.title_input, timeout=self.timeout)
         
     def fill_title(self, title: str):
         """填写申请标题"""
@@ -52,8 +83,10 @@ class ApprovalCreatePage(BasePage):
         
     def select_priority(self, priority: str):
         """选择优先级"""
-        # 点击对应的优先级选项
-        priority_option = f".priority-option[data-priority='{priority}']"
+        try:
+            priority_option = self.PRIORITY_SELECTORS[priority]
+        except KeyError:
+            raise ValueError(f"不支持的优先级: {priority}") from None
         self.click(priority_option)
         
     def fill_description(self, description: str):
@@ -94,17 +127,49 @@ class ApprovalCreatePage(BasePage):
         
     def verify_form_elements(self):
         """验证表单元素"""
-        expect(self.page.locator(self.title_input)).to_be_visible()
-        expect(self.page.locator(self.type_select)).to_be_visible()
-        expect(self.page.locator(".priority-selector")).to_be_visible()
-        expect(self.page.locator(self.description_textarea)).to_be_visible()
-        expect(self.page.locator(self.submit_button)).to_be_visible()
-        expect(self.page.locator(self.cancel_button)).to_be_visible()
+        self.expect_all_visible(
+            self.title_input, self.type_select, ".priority-selector",
+            self.description_textarea, self.submit_button, self.cancel_button,
+        )
 
 
 class ApprovalListPage(BasePage):
     """审批申请列表页面对象类"""
-    
+
+    __slots__ = ("_approvals",)
+
+    # 筛选器
+    filters = ".filters"
+    status_filter = "#statusFilter"
+    type_filter = "#typeFilter"
+    priority_filter = "#priorityFilter"
+    search_filter = "#searchFilter"
+    refresh_button = "#refreshBtn"
+
+    # 申请列表
+    approvals_container = ".approvals-container"
+    approvals_list = "#approvalsList"
+    approval_item = ".approval-item"
+    approval_title = ".approval-title"
+    approval_type = ".approval-type"
+    approval_priority = ".approval-priority"
+    approval_status = ".approval-status"
+    approval_submitter = ".approval-submitter"
+    approval_date = ".approval-date"
+    approval_actions = ".approval-actions"
+
+    # 操作按钮
+    view_button = "button:has-text('查看详情')"
+    approve_button = ".btn-approve"
+    reject_button = ".btn-reject"
+
+    # 空状态
+    empty_state = ".empty-state"
+
+    # 分页
+    pagination = ".pagination"
+    page_info = ".page-info"
+
     @property
     def url(self) -> str:
         """页面URL"""
@@ -117,44 +182,13 @@ class ApprovalListPage(BasePage):
     
     def __init__(self, page: Page):
         super().__init__(page)
-        
-        # 筛选器
-        self.filters = ".filters"
-        self.status_filter = "#statusFilter"
-        self.type_filter = "#typeFilter"
-        self.priority_filter = "#priorityFilter"
-        self.search_filter = "#searchFilter"
-        self.refresh_button = "#refreshBtn"
-        
-        # 申请列表
-        self.approvals_container = ".approvals-container"
-        self.approvals_list = "#approvalsList"
-        self.approval_item = ".approval-item"
-        self.approval_title = ".approval-title"
-        self.approval_type = ".approval-type"
-        self.approval_priority = ".approval-priority"
-        self.approval_status = ".approval-status"
-        self.approval_submitter = ".approval-submitter"
-        self.approval_date = ".approval-date"
-        self.approval_actions = ".approval-actions"
-        
-        # 操作按钮
-        self.view_button = "button:has-text('查看详情')"
-        self.approve_button = ".btn-approve"
-        self.reject_button = ".btn-reject"
-        
-        # 空状态
-        self.empty_state = ".empty-state"
-        
-        # 分页
-        self.pagination = ".pagination"
-        self.page_info = ".page-info"
 
-        
+        # Locator 惰性求值，可在页面对象生命周期内复用
+        self._approvals = self.page.locator(self.approval_item)
+
     def wait_for_approval_list_page_load(self):
         """等待页面加载完成"""
-        self.wait_for_element(self.filters)
-        self.wait_for_element(self.approvals_list)
+        self.expect_all_visible(self.filters, self.approvals_list, timeout=self.timeout)
         
     def filter_by_status(self, status: str):
         """按状态筛选"""
@@ -178,112 +212,134 @@ class ApprovalListPage(BasePage):
         
     def get_approval_count(self) -> int:
         """获取申请数量"""
-        return self.page.locator(self.approval_item).count()
+        return self._approvals.count()
         
     def get_approval_titles(self) -> List[str]:
         """获取所有申请标题"""
-        titles = []
-        items = self.page.locator(self.approval_item)
-        for i in range(items.count()):
-            title = items.nth(i).locator(self.approval_title).text_content()
-            titles.append(title)
-        return titles
+        # 一次调用取回全部文本，避免逐项往返
+        return self._approvals.locator(self.approval_title).all_text_contents()
         
     def click_view_approval(self, index: int = 0):
         """点击查看申请详情"""
-        items = self.page.locator(self.approval_item)
-        if index < items.count():
-            # 点击申请项内的查看详情按钮
-            items.nth(index).locator(self.view_button).click()
-        else:
+        items = self._approvals
+        # 越界时立即报错，而不是等待点击超时；点击本身的超时（如被遮挡）原样抛出
+        if index >= items.count():
             raise IndexError(f"申请索引 {index} 超出范围")
+        items.nth(index).locator(self.view_button).click()
             
     def click_approve_approval(self, index: int = 0):
         """点击批准申请"""
-        items = self.page.locator(self.approval_item)
-        if index < items.count():
-            items.nth(index).locator(self.approve_button).click()
-        else:
+        items = self._approvals
+        if index >= items.count():
             raise IndexError(f"申请索引 {index} 超出范围")
+        items.nth(index).locator(self.approve_button).click()
             
     def click_reject_approval(self, index: int = 0):
         """点击拒绝申请"""
-        items = self.page.locator(self.approval_item)
-        if index < items.count():
-            items.nth(index).locator(self.reject_button).click()
-        else:
+        items = self._approvals
+        if index >= items.count():
             raise IndexError(f"申请索引 {index} 超出范围")
+        items.nth(index).locator(self.reject_button).click()
             
     def get_approval_info(self, index: int = 0) -> Dict[str, str]:
-        """获取指定申请的信息"""
+        """获取指定申请的信息（每次调用都从页面读取）"""
         # 等待申请列表加载
         self.page.wait_for_selector(self.approval_item, timeout=10000)
-        
-        items = self.page.locator(self.approval_item)
+
+        items = self._approvals
         if index >= items.count():
             raise IndexError(f"申请索引 {index} 超出范围")
-            
+
         item = items.nth(index)
-        
-        # 等待每个元素可见后再获取文本
+
+        # 等待标题可见后再获取文本
         item.locator(self.approval_title).wait_for(state="visible", timeout=5000)
-        
-        # 获取类型信息 - 从meta-item中查找包含"类型"的项目
-        type_text = ""
-        try:
-            meta_items = item.locator('.meta-item')
-            for i in range(meta_items.count()):
-                meta_item = meta_items.nth(i)
-                label_text = meta_item.locator('.meta-label').text_content(timeout=1000) or ""
-                if '类型' in label_text:
-                    type_text = meta_item.locator('.meta-value').text_content(timeout=1000) or ""
-                    break
-        except:
-            type_text = ""
-        
-        # 获取提交时间 - 从meta-item中查找包含"提交时间"的项目
-        date_text = ""
-        try:
-            meta_items = item.locator('.meta-item')
-            for i in range(meta_items.count()):
-                meta_item = meta_items.nth(i)
-                label_text = meta_item.locator('.meta-label').text_content(timeout=1000) or ""
-                if '提交时间' in label_text:
-                    date_text = meta_item.locator('.meta-value').text_content(timeout=1000) or ""
-                    break
-        except:
-            date_text = ""
-        
-        return {
-            "title": item.locator(self.approval_title).text_content(timeout=5000) or "",
-            "type": type_text,
-            "priority": item.locator('.priority-badge').text_content(timeout=5000) or "",
-            "status": item.locator('.status-badge').text_content(timeout=5000) or "",
-            "submitter": "",  # 提交者信息不在当前HTML结构中
-            "date": date_text
-        }
+        return item.evaluate(_APPROVAL_ROW_JS, self.approval_title)
+
+    def get_all_approval_info(self) -> List[Dict[str, str]]:
+        """
+        在浏览器内一次读取当前列表中全部申请的信息
+
+        结果是调用时刻的快照，不做缓存；遍历列表查找申请时用它代替逐个 get_approval_info。
+        """
+        # 等待申请列表加载
+        self.page.wait_for_selector(self.approval_item, timeout=10000)
+        return self._approvals.evaluate_all(_ALL_APPROVAL_ROWS_JS, self.approval_title)
         
     def is_empty_state_visible(self) -> bool:
         """检查是否显示空状态"""
         return self.is_visible(self.empty_state)
         
-    def wait_for_approval_update(self, timeout: int = 5000):
-        """等待申请状态更新"""
-        self.page.wait_for_timeout(timeout)  # 等待状态更新
+    def wait_for_approval_update(self, expected: Optional[Union[str, Pattern[str]]] = None,
+                                 index: int = 0, timeout: int = 5000):
+        """
+        等待指定申请的状态更新
+
+        Args:
+            expected: 期望的状态文本或正则；为 None 时等待状态离开"待审批"
+            index: 申请索引
+            timeout: 超时时间（毫秒）
+        """
+        if isinstance(expected, int):
+            # 兼容旧签名 wait_for_approval_update(timeout)
+            warnings.warn(
+                "wait_for_approval_update(timeout) 已废弃，请传入期望状态并以关键字参数指定 timeout",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            expected, timeout = None, expected
+        status = self._approvals.nth(index).locator('.status-badge')
+        if expected is None:
+            expect(status).not_to_have_text(PENDING_STATUS, timeout=timeout)
+        else:
+            expect(status).to_have_text(expected, timeout=timeout)
         
     def verify_list_elements(self):
         """验证列表页面元素"""
-        expect(self.page.locator(self.filters)).to_be_visible()
-        expect(self.page.locator(self.status_filter)).to_be_visible()
-        expect(self.page.locator(self.type_filter)).to_be_visible()
-        expect(self.page.locator(self.priority_filter)).to_be_visible()
-        expect(self.page.locator(self.search_filter)).to_be_visible()
-        expect(self.page.locator(self.refresh_button)).to_be_visible()
+        self.expect_all_visible(
+            self.filters, self.status_filter, self.type_filter,
+            self.priority_filter, self.search_filter, self.refresh_button,
+        )
 
 
 class ApprovalDetailPage(BasePage):
     """审批申请详情页面对象类"""
-    
+
+    __slots__ = ("_history_items",)
+
+    base_url = "http://localhost:8080/pages/approval-detail.html"
+
+    # 页面头部
+    approval_header = ".page-header"
+    approval_title = "#pageTitle"
+    approval_status = ".status-badge"
+    approval_info = ".detail-grid"
+    approval_description = ".description-content"
+
+    # 申请信息字段
+    submitter_info = ".submitter-info"
+    submit_time = ".submit-time"
+    approval_type = ".approval-type"
+    approval_priority = ".approval-priority"
+
+    # 审批历史
+    approval_history = ".approval-history"
+    history_item = ".history-item"
+    history_action = ".history-action"
+    history_user = ".history-user"
+    history_time = ".history-time"
+    history_comment = ".history-comment"
+
+    # 审批操作
+    approval_actions = ".approval-actions"
+    approve_button = "button:has-text('通过申请')"
+    reject_button = "button:has-text('拒绝申请')"
+    comment_textarea = "#approvalComment"
+
+    # 导航
+    back_button = "a.btn.btn-secondary"
+    breadcrumb = ".breadcrumb"
+
     @property
     def url(self) -> str:
         """页面URL"""
@@ -296,49 +352,19 @@ class ApprovalDetailPage(BasePage):
     
     def __init__(self, page: Page):
         super().__init__(page)
-        self.base_url = "http://localhost:8080/pages/approval-detail.html"
-        
-        # 页面头部
-        self.approval_header = ".page-header"
-        self.approval_title = "#pageTitle"
-        self.approval_status = ".status-badge"
-        self.approval_info = ".detail-grid"
-        self.approval_description = ".description-content"
-        
-        # 申请信息字段
-        self.submitter_info = ".submitter-info"
-        self.submit_time = ".submit-time"
-        self.approval_type = ".approval-type"
-        self.approval_priority = ".approval-priority"
-        
-        # 审批历史
-        self.approval_history = ".approval-history"
-        self.history_item = ".history-item"
-        self.history_action = ".history-action"
-        self.history_user = ".history-user"
-        self.history_time = ".history-time"
-        self.history_comment = ".history-comment"
-        
-        # 审批操作
-        self.approval_actions = ".approval-actions"
-        self.approve_button = "button:has-text('通过申请')"
-        self.reject_button = "button:has-text('拒绝申请')"
-        self.comment_textarea = "#approvalComment"
-        
-        # 导航
-        self.back_button = "a.btn.btn-secondary"
-        self.breadcrumb = ".breadcrumb"
-        
+
+        self._history_items = self.page.locator(self.history_item)
+
     def navigate_with_id(self, approval_id: str):
         """导航到指定ID的申请详情页面"""
         url = f"{self.url}?id={approval_id}"
-        self.page.goto(url)
-        self.wait_for_page_load()
+        # 不等待 load/networkidle，详情内容渲染出来即可操作
+        self.page.goto(url, wait_until="domcontentloaded", timeout=self.long_timeout)
+        self.wait_for_approval_detail_page_load()
         
     def wait_for_approval_detail_page_load(self):
         """等待页面加载完成"""
-        self.wait_for_element(self.approval_header)
-        self.wait_for_element(self.approval_info)
+        self.expect_all_visible(self.approval_header, self.approval_info, timeout=self.timeout)
         
     def get_approval_title(self) -> str:
         """获取申请标题"""
@@ -384,7 +410,7 @@ class ApprovalDetailPage(BasePage):
         # 提交审批表单
         self.page.locator("button[type='submit']").click()
         # 等待审批处理完成
-        self.page.wait_for_timeout(2000)
+        self.wait_for_approval_processed()
         
     def reject_with_comment(self, comment: str = ""):
         """拒绝申请并添加意见"""
@@ -398,7 +424,7 @@ class ApprovalDetailPage(BasePage):
         # 提交审批表单
         self.page.locator("button[type='submit']").click()
         # 等待审批处理完成
-        self.page.wait_for_timeout(2000)
+        self.wait_for_approval_processed()
         
     def click_back(self):
         """点击返回按钮"""
@@ -406,37 +432,37 @@ class ApprovalDetailPage(BasePage):
         
     def get_history_count(self) -> int:
         """获取审批历史记录数量"""
-        return self.page.locator(self.history_item).count()
+        return self._history_items.count()
         
     def get_history_items(self) -> List[Dict[str, str]]:
         """获取所有审批历史记录"""
-        items = []
-        history_elements = self.page.locator(self.history_item)
-        
-        for i in range(history_elements.count()):
-            item = history_elements.nth(i)
-            items.append({
-                "action": item.locator(self.history_action).text_content(),
-                "user": item.locator(self.history_user).text_content(),
-                "time": item.locator(self.history_time).text_content(),
-                "comment": item.locator(self.history_comment).text_content() or ""
-            })
-        return items
+        # 在浏览器内一次性读取所有记录的各字段
+        return self._history_items.evaluate_all(
+            """(els, sel) => els.map(e => {
+                const text = s => e.querySelector(s)?.textContent || '';
+                return {action: text(sel.action), user: text(sel.user), time: text(sel.time), comment: text(sel.comment)};
+            })""",
+            {
+                "action": self.history_action,
+                "user": self.history_user,
+                "time": self.history_time,
+                "comment": self.history_comment,
+            },
+        )
         
     def is_approval_actions_visible(self) -> bool:
         """检查审批操作区域是否可见"""
         return self.is_visible(self.approval_actions)
         
     def wait_for_approval_processed(self, timeout: int = 5000):
-        """等待审批处理完成"""
-        # 等待页面状态更新
-        self.page.wait_for_timeout(timeout)
+        """等待审批处理完成：状态徽标不再显示待审批"""
+        # 历史记录、列表等区域也会渲染 .status-badge，限定在详情页头部内，只匹配申请本身的状态
+        status = self.page.locator(self.approval_header).locator(self.approval_status)
+        expect(status).not_to_have_text(PENDING_STATUS, timeout=timeout)
         
     def verify_detail_elements(self):
         """验证详情页面元素"""
-        expect(self.page.locator(self.approval_header)).to_be_visible()
-        expect(self.page.locator(self.approval_title)).to_be_visible()
-        expect(self.page.locator(self.approval_status)).to_be_visible()
-        expect(self.page.locator(self.approval_info)).to_be_visible()
-        expect(self.page.locator(self.approval_description)).to_be_visible()
-        expect(self.page.locator(self.back_button)).to_be_visible()
\ No newline at end of file
+        self.expect_all_visible(
+            self.approval_header, self.approval_title, self.approval_status,
+            self.approval_info, self.approval_description, self.back_button,
+        )
\ No newline at end of file
@@ -1,11 +1,70 @@
-from playwright.sync_api import Page, expect
+from typing import ClassVar, Dict, Optional
+
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError, expect
 
 from core.base_page import BasePage
 
+# 按卡片标题一次读取全部统计数字，卡片不存在时对应值为 null
+_DASHBOARD_STATS_JS = """
+(labels) => {
+    const cards = Array.from(document.querySelectorAll('.stat-card'));
+    const read = label => {
+        const card = cards.find(c => c.textContent.includes(label));
+        return card ? (card.querySelector('.stat-number')?.textContent ?? null) : null;
+    };
+    return Object.fromEntries(Object.entries(labels).map(([key, label]) => [key, read(label)]));
+}
+"""
+
 
 class DashboardPage(BasePage):
     """仪表板页面对象类"""
-    
+
+    __slots__ = ("_activities", "_pending_items")
+
+    # 页面头部元素
+    page_header = ".dashboard-header"
+    user_info = ".user-info"
+    user_avatar = ".user-avatar"
+    user_name = ".user-name"
+    user_role = ".user-role"
+    logout_button = "button.btn.btn-secondary"
+
+    # 统计卡片
+    stats_container = ".stats-grid"
+    pending_approvals_card = ".stat-card:has-text('待处理审批')"
+    submitted_approvals_card = ".stat-card:has-text('我的申请')"
+    total_users_card = ".stat-card:has-text('系统用户')"
+    stat_numbers = ".stat-number"
+    # 统计项 -> 卡片标题
+    STAT_LABELS: ClassVar[Dict[str, str]] = {"pending": "待处理审批", "submitted": "我的申请", "total_users": "系统用户"}
+
+    # 快速操作区域
+    quick_actions = ".quick-actions"
+    create_approval_btn = "#createApprovalBtn"
+    approval_list_btn = "#approvalListBtn"
+    user_management_btn = "#userManagementBtn"
+
+    # 最近活动区域
+    recent_activities = ".recent-activities"
+    activities_list = ".activities-list"
+    activity_item = ".activity-item"
+    activity_title = ".activity-title"
+    activity_time = ".activity-time"
+    activity_status = ".activity-status"
+
+    # 待处理事项区域
+    pending_items = ".pending-items"
+    pending_list = ".pending-list"
+    pending_item = ".pending-item"
+    pending_title = ".pending-title"
+    pending_priority = ".pending-priority"
+    pending_submitter = ".pending-submitter"
+
+    # 空状态
+    empty_state = ".empty-state"
+    empty_message = ".empty-message"
+
     @property
     def url(self) -> str:
         """页面URL"""
@@ -18,53 +77,14 @@ class DashboardPage(BasePage):
     
     def __init__(self, page: Page):
         super().__init__(page)
-        
-        # 页面头部元素
-        self.page_header = ".dashboard-header"
-        self.user_info = ".user-info"
-        self.user_avatar = ".user-avatar"
-        self.user_name = ".user-name"
-        self.user_role = ".user-role"
-        self.logout_button = "button.btn.btn-secondary"
-        
-        # 统计卡片
-        self.stats_container = ".stats-grid"
-        self.pending_approvals_card = ".stat-card:has-text('待处理审批')"
-        self.submitted_approvals_card = ".stat-card:has-text('我的申请')"
-        self.total_users_card = ".stat-card:has-text('系统用户')"
-        self.stat_numbers = ".stat-number"
-        
-        # 快速操作区域
-        self.quick_actions = ".quick-actions"
-        self.create_approval_btn = "#createApprovalBtn"
-        self.approval_list_btn = "#approvalListBtn"
-        self.user_management_btn = "#userManagementBtn"
-        
-        # 最近活动区域
-        self.recent_activities = ".recent-activities"
-        self.activities_list = ".activities-list"
-        self.activity_item = ".activity-item"
-        self.activity_title = ".activity-title"
-        self.activity_time = ".activity-time"
-        self.activity_status = ".activity-status"
-        
-        # 待处理事项区域
-        self.pending_items = ".pending-items"
-        self.pending_list = ".pending-list"
-        self.pending_item = ".pending-item"
-        self.pending_title = ".pending-title"
-        self.pending_priority = ".pending-priority"
-        self.pending_submitter = ".pending-submitter"
-        
-        # 空状态
-        self.empty_state = ".empty-state"
-        self.empty_message = ".empty-message"
 
-        
+        # Locator 惰性求值，可在页面对象生命周期内复用
+        self._activities = self.page.locator(self.activity_item)
+        self._pending_items = self.page.locator(self.pending_item)
+
     def wait_for_dashboard_page_load(self):
         """等待页面加载完成"""
-        self.wait_for_element(self.stats_container)
-        self.wait_for_element(self.user_info)
+        self.expect_all_visible(self.stats_container, self.user_info, timeout=self.timeout)
         
     def get_user_name(self) -> str:
         """获取当前用户姓名"""
@@ -88,41 +108,44 @@ class DashboardPage(BasePage):
     def logout(self):
         """执行退出登录操作"""
         self.click_logout()
-        # 等待一段时间让JavaScript执行
-        self.page.wait_for_timeout(2000)
-        # 直接导航到登录页面
-        self.page.goto("http://localhost:8080/pages/login.html")
-        # 等待页面加载
-        self.page.wait_for_load_state("load")
+        # 页面跳转到登录页即返回；未自动跳转时再手动导航
+        self.wait_for_logout_redirect(timeout=5000)
         
     def wait_for_logout_redirect(self, timeout: int = 10000):
         """等待登出后重定向到登录页面"""
         try:
             # 等待URL变化到登录页面
             self.page.wait_for_url("**/login.html", timeout=timeout)
-        except TimeoutError:
+        except PlaywrightTimeoutError:
             # 如果自动重定向失败，手动导航到登录页面
             try:
-                self.page.goto("http://localhost:8080/pages/login.html")
-                self.page.wait_for_load_state("load")
+                self.page.goto("http://localhost:8080/pages/login.html", wait_until="domcontentloaded")
             except Exception as e:
                 current_url = self.page.url
                 raise Exception(f"未能重定向到登录页面，当前URL: {current_url}, 错误: {str(e)}")
         
-    def get_pending_approvals_count(self) -> str:
+    def get_dashboard_stats(self) -> Dict[str, Optional[str]]:
+        """
+        一次读取全部统计数字
+
+        Returns:
+            {"pending": ..., "submitted": ..., "total_users": ...}，当前用户看不到的卡片为 None
+        """
+        # 统计卡片随页面数据渲染，读取前确认数字已出现
+        self.page.locator(self.stat_numbers).first.wait_for(state="attached")
+        return self._evaluate_cached(_DASHBOARD_STATS_JS, self.STAT_LABELS)
+
+    def get_pending_approvals_count(self) -> Optional[str]:
         """获取待处理审批数量"""
-        card = self.page.locator(self.pending_approvals_card)
-        return card.locator(self.stat_numbers).text_content()
+        return self.get_dashboard_stats()["pending"]
         
-    def get_submitted_approvals_count(self) -> str:
+    def get_submitted_approvals_count(self) -> Optional[str]:
         """获取我的申请数量"""
-        card = self.page.locator(self.submitted_approvals_card)
-        return card.locator(self.stat_numbers).text_content()
+        return self.get_dashboard_stats()["submitted"]
         
-    def get_total_users_count(self) -> str:
+    def get_total_users_count(self) -> Optional[str]:
         """获取系统用户数量"""
-        card = self.page.locator(self.total_users_card)
-        return card.locator(self.stat_numbers).text_content()
+        return self.get_dashboard_stats()["total_users"]
         
     def click_create_approval(self):
         """点击创建审批申请按钮"""
@@ -150,47 +173,36 @@ class DashboardPage(BasePage):
         
     def get_recent_activities_count(self) -> int:
         """获取最近活动数量"""
-        activities = self.page.locator(self.activity_item)
+        activities = self._activities
         return activities.count()
         
     def get_recent_activity_titles(self) -> list[str]:
         """获取最近活动标题列表"""
-        activities = self.page.locator(self.activity_item)
-        titles = []
-        for i in range(activities.count()):
-            title = activities.nth(i).locator(self.activity_title).text_content()
-            titles.append(title)
-        return titles
+        return self._activities.locator(self.activity_title).all_text_contents()
         
     def get_pending_items_count(self) -> int:
         """获取待处理事项数量"""
-        items = self.page.locator(self.pending_item)
+        items = self._pending_items
         return items.count()
         
     def get_pending_item_titles(self) -> list[str]:
         """获取待处理事项标题列表"""
-        items = self.page.locator(self.pending_item)
-        titles = []
-        for i in range(items.count()):
-            title = items.nth(i).locator(self.pending_title).text_content()
-            titles.append(title)
-        return titles
+        return self._pending_items.locator(self.pending_title).all_text_contents()
         
     def click_pending_item(self, index: int = 0):
         """点击指定的待处理事项"""
-        items = self.page.locator(self.pending_item)
-        if index < items.count():
-            items.nth(index).click()
-        else:
+        items = self._pending_items
+        # 越界时立即报错，而不是等待点击超时；点击本身的超时（如被遮挡）原样抛出
+        if index >= items.count():
             raise IndexError(f"待处理事项索引 {index} 超出范围")
+        items.nth(index).click()
             
     def click_activity_item(self, index: int = 0):
         """点击指定的活动项"""
-        activities = self.page.locator(self.activity_item)
-        if index < activities.count():
-            activities.nth(index).click()
-        else:
+        activities = self._activities
+        if index >= activities.count():
             raise IndexError(f"活动项索引 {index} 超出范围")
+        activities.nth(index).click()
             
     def is_user_management_button_visible(self) -> bool:
         """检查用户管理按钮是否可见（仅管理员可见）"""
@@ -206,27 +218,19 @@ class DashboardPage(BasePage):
         
     def verify_dashboard_elements(self):
         """验证仪表板页面关键元素"""
-        # 验证页面头部
-        expect(self.page.locator(self.page_header)).to_be_visible()
-        expect(self.page.locator(self.user_info)).to_be_visible()
-        expect(self.page.locator(self.user_name)).to_be_visible()
-        expect(self.page.locator(self.user_role)).to_be_visible()
-        expect(self.page.locator(self.logout_button)).to_be_visible()
-        
-        # 验证统计卡片
-        expect(self.page.locator(self.stats_container)).to_be_visible()
-        expect(self.page.locator(self.pending_approvals_card)).to_be_visible()
-        expect(self.page.locator(self.submitted_approvals_card)).to_be_visible()
-        
-        # 验证快速操作
-        expect(self.page.locator(self.quick_actions)).to_be_visible()
-        expect(self.page.locator(self.create_approval_btn)).to_be_visible()
+        self.expect_all_visible(
+            # 页面头部
+            self.page_header, self.user_info, self.user_name, self.user_role, self.logout_button,
+            # 统计卡片
+            self.stats_container, self.pending_approvals_card, self.submitted_approvals_card,
+            # 快速操作
+            self.quick_actions, self.create_approval_btn,
+        )
         expect(self.page.locator(self.approval_list_btn)).to_be_visible()
         
     def verify_admin_elements(self):
         """验证管理员专用元素"""
-        expect(self.page.locator(self.total_users_card)).to_be_visible()
-        expect(self.page.locator(self.user_management_btn)).to_be_visible()
+        self.expect_all_visible(self.total_users_card, self.user_management_btn)
         
     def verify_user_elements(self):
         """验证普通用户元素（不包含管理员功能）"""
@@ -240,21 +244,21 @@ class DashboardPage(BasePage):
         
     def verify_responsive_design(self):
         """验证响应式设计"""
-        # 切换到移动端视口
-        self.page.set_viewport_size({"width": 375, "height": 667})
-        
-        # 验证关键元素在移动端仍然可见
-        expect(self.page.locator(self.user_info)).to_be_visible()
-        expect(self.page.locator(self.stats_container)).to_be_visible()
-        expect(self.page.locator(self.quick_actions)).to_be_visible()
-        
-        # 恢复桌面端视口
-        self.page.set_viewport_size({"width": 1280, "height": 720})
+        # 记录原视口，验证后按原尺寸恢复，而不是固定的 1280x720
+        original = self.get_viewport_size()
+        mobile = {"width": 375, "height": 667}
+        if original != mobile:
+            self.set_viewport_size(**mobile)
+        try:
+            # 验证关键元素在移动端仍然可见
+            self.expect_all_visible(self.user_info, self.stats_container, self.quick_actions)
+        finally:
+            if original["width"] and original != mobile:
+                self.set_viewport_size(**original)
         
     def wait_for_data_load(self, timeout: int = 10000):
         """等待数据加载完成"""
-        # 等待统计数据加载
-        self.page.wait_for_function(
-            "document.querySelector('.stat-number').textContent !== '0'",
-            timeout=timeout
-        )
\ No newline at end of file
+        # 统计数据随页面加载时的请求渲染：等待网络空闲后确认统计数字已出现，
+        # 不轮询数字内容，真实数量为 0 时也能正常返回
+        self.page.wait_for_load_state("networkidle", timeout=timeout)
+        self.page.locator(self.stat_numbers).first.wait_for(state="attached", timeout=timeout)
\ No newline at end of file
@@ -1,11 +1,29 @@
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 
 from core.base_page import BasePage
 
 
 class LoginPage(BasePage):
     """登录页面对象类"""
-    
+
+    __slots__ = ()
+
+    # 页面元素定位器
+    username_input = "#username"
+    password_input = "#password"
+    remember_checkbox = "#rememberMe"
+    login_button = "button[type='submit']"
+    demo_admin_button = ".demo-account[data-username='admin']"
+    demo_user_button = ".demo-account[data-username='user1']"
+    error_message = "#errorMessage"
+    success_message = ".success-message"
+    loading_state = ".btn.loading"
+
+    # 页面标题和标识元素
+    page_title = "h1.login-title"
+    login_form = "#loginForm"
+    demo_accounts_section = ".demo-accounts"
+
     @property
     def url(self) -> str:
         """页面URL"""
@@ -16,31 +34,11 @@ class LoginPage(BasePage):
         """页面标题"""
         return "登录 - 审批系统"
     
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # 页面元素定位器
-        self.username_input = "#username"
-        self.password_input = "#password"
-        self.remember_checkbox = "#rememberMe"
-        self.login_button = "button[type='submit']"
-        self.demo_admin_button = ".demo-account[data-username='admin']"
-        self.demo_user_button = ".demo-account[data-username='user1']"
-        self.error_message = "#errorMessage"
-        self.success_message = ".success-message"
-        self.loading_state = ".btn.loading"
-        
-        # 页面标题和标识元素
-        self.page_title = "h1.login-title"
-        self.login_form = "#loginForm"
-        self.demo_accounts_section = ".demo-accounts"
-        
     def wait_for_login_page_load(self):
         """等待页面加载完成"""
         # 使用更长的超时时间等待关键元素
-        self.wait_for_element(self.login_form, timeout=self.long_timeout)
-        self.wait_for_element(self.username_input, timeout=self.long_timeout)
-        self.wait_for_element(self.password_input, timeout=self.long_timeout)
+        self.expect_all_visible(self.login_form, self.username_input, self.password_input,
+                                timeout=self.long_timeout)
         
     def enter_username(self, username: str):
         """输入用户名"""
@@ -138,15 +136,11 @@ class LoginPage(BasePage):
         
     def verify_login_page_elements(self):
         """验证登录页面关键元素是否存在"""
-        # 验证表单元素
-        expect(self.page.locator(self.username_input)).to_be_visible()
-        expect(self.page.locator(self.password_input)).to_be_visible()
-        expect(self.page.locator(self.remember_checkbox)).to_be_visible()
-        expect(self.page.locator(self.login_button)).to_be_visible()
-        
-        # 验证演示账号按钮
-        expect(self.page.locator(self.demo_admin_button)).to_be_visible()
-        expect(self.page.locator(self.demo_user_button)).to_be_visible()
+        # 验证表单元素与演示账号按钮
+        self.expect_all_visible(
+            self.username_input, self.password_input, self.remember_checkbox, self.login_button,
+            self.demo_admin_button, self.demo_user_button,
+        )
         
         # 验证页面标题
         expect(self.page.locator(self.page_title)).to_contain_text("登录")
@@ -170,13 +164,14 @@ class LoginPage(BasePage):
         
     def verify_responsive_design(self, width: int = 375, height: int = 667):
         """验证响应式设计（移动端适配）"""
-        # 切换到指定视口
-        self.page.set_viewport_size({"width": width, "height": height})
-        
-        # 验证元素在指定视口下仍然可见
-        expect(self.page.locator(self.login_form)).to_be_visible()
-        expect(self.page.locator(self.username_input)).to_be_visible()
-        expect(self.page.locator(self.password_input)).to_be_visible()
-        
-        # 恢复桌面视口
-        self.page.set_viewport_size({"width": 1280, "height": 720})
\ No newline at end of file
+        # 记录原视口，验证后按原尺寸恢复；与目标尺寸相同时不切换，避免多余的重排
+        original = self.get_viewport_size()
+        target = {"width": width, "height": height}
+        if original != target:
+            self.set_viewport_size(width, height)
+        try:
+            # 验证元素在指定视口下仍然可见
+            self.expect_all_visible(self.login_form, self.username_input, self.password_input)
+        finally:
+            if original["width"] and original != target:
+                self.set_viewport_size(**original)
\ No newline at end of file
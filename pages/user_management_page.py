@@ -1,4 +1,3 @@
-from playwright.sync_api import Page, expect
 from typing import List, Dict, Optional, Literal
 
 from core.base_page import BasePage
@@ -6,7 +5,60 @@ from core.base_page import BasePage
 
 class UserManagementPage(BasePage):
     """用户管理页面对象"""
-    
+
+    __slots__ = ()
+
+    # 页面头部
+    page_header = ".page-header"
+    page_title = ".page-title"
+    add_user_button = "#addUserBtn"
+    refresh_button = "#refreshBtn"
+
+    # 筛选器
+    role_filter = "#roleFilter"
+    status_filter = "#statusFilter"
+    search_filter = "#searchFilter"
+
+    # 用户列表
+    users_container = ".users-container"
+    users_table = "#usersTable"
+    users_table_body = "#usersTableBody"
+    users_count = "#usersCount"
+    user_row = "#usersTableBody tr"
+
+    # 用户信息
+    user_avatar = ".user-avatar"
+    user_name = ".user-name"
+    user_username = ".user-username"
+    user_email = "td:nth-child(2)"
+    role_badge = ".role-badge"
+    status_badge = ".status-badge"
+
+    # 用户操作
+    user_actions = ".user-actions"
+    edit_user_button = ".btn-sm:has-text('编辑')"
+    delete_user_button = ".btn-sm:has-text('删除')"
+    toggle_status_button = ".btn-sm:has-text('禁用'), .btn-sm:has-text('启用')"
+
+    # 模态框
+    user_modal = "#userModal"
+    modal_title = "#modalTitle"
+    user_form = "#userForm"
+    save_user_button = "#saveUserBtn"
+    close_modal_button = ".close"
+
+    # 表单字段
+    username_input = "#username"
+    name_input = "#name"
+    email_input = "#email"
+    password_input = "#password"
+    role_select = "#role"
+    status_select = "#status"
+    form_message = "#userFormMessage"
+
+    # 空状态
+    empty_state = ".empty-state"
+
     @property
     def url(self) -> str:
         return "http://localhost:8080/pages/user-management.html"
@@ -15,60 +67,6 @@ class UserManagementPage(BasePage):
     def title(self) -> str:
         return "用户管理 - 测试系统"
         
-    def __init__(self, page: Page):
-        super().__init__(page)
-        
-        # 页面头部
-        self.page_header = ".page-header"
-        self.page_title = ".page-title"
-        self.add_user_button = "#addUserBtn"
-        self.refresh_button = "#refreshBtn"
-        
-        # 筛选器
-        self.role_filter = "#roleFilter"
-        self.status_filter = "#statusFilter"
-        self.search_filter = "#searchFilter"
-        
-        # 用户列表
-        self.users_container = ".users-container"
-        self.users_table = "#usersTable"
-        self.users_table_body = "#usersTableBody"
-        self.users_count = "#usersCount"
-        self.user_row = "#usersTableBody tr"
-        
-        # 用户信息
-        self.user_avatar = ".user-avatar"
-        self.user_name = ".user-name"
-        self.user_username = ".user-username"
-        self.user_email = "td:nth-child(2)"
-        self.role_badge = ".role-badge"
-        self.status_badge = ".status-badge"
-        
-        # 用户操作
-        self.user_actions = ".user-actions"
-        self.edit_user_button = ".btn-sm:has-text('编辑')"
-        self.delete_user_button = ".btn-sm:has-text('删除')"
-        self.toggle_status_button = ".btn-sm:has-text('禁用'), .btn-sm:has-text('启用')"
-        
-        # 模态框
-        self.user_modal = "#userModal"
-        self.modal_title = "#modalTitle"
-        self.user_form = "#userForm"
-        self.save_user_button = "#saveUserBtn"
-        self.close_modal_button = ".close"
-        
-        # 表单字段
-        self.username_input = "#username"
-        self.name_input = "#name"
-        self.email_input = "#email"
-        self.password_input = "#password"
-        self.role_select = "#role"
-        self.status_select = "#status"
-        self.form_message = "#userFormMessage"
-        
-        # 空状态
-        self.empty_state = ".empty-state"
-        
     def navigate(self, url: Optional[str] = None, wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = "domcontentloaded") -> 'BasePage':
         """导航到用户管理页面"""
         return super().navigate(url, wait_until)
@@ -76,8 +74,7 @@ class UserManagementPage(BasePage):
     def wait_for_page_load(self, timeout: Optional[int] = None) -> None:
         """等待页面加载完成"""
         super().wait_for_page_load(timeout)
-        self.wait_for_element(self.page_header)
-        self.wait_for_element(self.users_container)
+        self.expect_all_visible(self.page_header, self.users_container, timeout=self.timeout)
         
     def click_add_user(self):
         """点击添加用户按钮"""
@@ -263,24 +260,17 @@ class UserManagementPage(BasePage):
         
     def verify_page_elements(self):
         """验证页面元素"""
-        expect(self.page.locator(self.page_header)).to_be_visible()
-        expect(self.page.locator(self.add_user_button)).to_be_visible()
-        expect(self.page.locator(self.search_filter)).to_be_visible()
-        expect(self.page.locator(self.role_filter)).to_be_visible()
-        expect(self.page.locator(self.status_filter)).to_be_visible()
-        expect(self.page.locator(self.refresh_button)).to_be_visible()
-        expect(self.page.locator(self.users_container)).to_be_visible()
+        self.expect_all_visible(
+            self.page_header, self.add_user_button, self.search_filter, self.role_filter,
+            self.status_filter, self.refresh_button, self.users_container,
+        )
         
     def verify_user_form_elements(self):
         """验证用户表单元素"""
-        expect(self.page.locator(self.name_input)).to_be_visible()
-        expect(self.page.locator(self.username_input)).to_be_visible()
-        expect(self.page.locator(self.email_input)).to_be_visible()
-        expect(self.page.locator(self.password_input)).to_be_visible()
-        expect(self.page.locator(self.role_select)).to_be_visible()
-        expect(self.page.locator(self.status_select)).to_be_visible()
-        expect(self.page.locator(self.save_user_button)).to_be_visible()
-        expect(self.page.locator(self.close_modal_button)).to_be_visible()
+        self.expect_all_visible(
+            self.name_input, self.username_input, self.email_input, self.password_input,
+            self.role_select, self.status_select, self.save_user_button, self.close_modal_button,
+        )
         
     def verify_user_in_list(self, username: str) -> bool:
         """验证用户是否在列表中"""
@@ -21,14 +21,9 @@ class TestDemoUserLogin(BaseTest):
         # 点击演示普通用户账号
         self.login_page.click_demo_user_button()
 
-        # 等待表单填充完成
-        self.page.wait_for_timeout(500)
-
-        # 验证表单自动填充
-        username = self.login_page.get_username_value()
-        password = self.login_page.get_password_value()
-        self.assertEqual(username, "user1")
-        self.assertEqual(password, "user123")
+        # 验证表单自动填充（自动等待至填充完成）
+        expect(self.page.locator(self.login_page.username_input)).to_have_value("user1")
+        expect(self.page.locator(self.login_page.password_input)).to_have_value("user123")
 
         # 提交登录
         self.login_page.click_login_button()
@@ -86,15 +86,13 @@ class TestApprovalHistoryTracking(BaseTest):
         self.approval_list_page.navigate()
 
         # 查找申请并查看详情
-        for i in range(self.approval_list_page.get_approval_count()):
-            approval_info = self.approval_list_page.get_approval_info(i)
+        for i, approval_info in enumerate(self.approval_list_page.get_all_approval_info()):
             if approval_title in approval_info["title"]:
                 self.approval_list_page.click_view_approval(i)
                 break
 
         # 批准申请
         self.approval_detail_page.approve_with_comment("经审核，同意此申请。")
-        self.approval_detail_page.wait_for_approval_processed()
 
         # 验证历史记录
         history_count = self.approval_detail_page.get_history_count()
@@ -91,15 +91,13 @@ class TestApprovalRejectionWorkflow(BaseTest):
         self.approval_list_page.navigate()
 
         # 查找并处理申请
-        for i in range(self.approval_list_page.get_approval_count()):
-            approval_info = self.approval_list_page.get_approval_info(i)
+        for i, approval_info in enumerate(self.approval_list_page.get_all_approval_info()):
             if approval_title in approval_info["title"]:
                 self.approval_list_page.click_view_approval(i)
                 break
 
         # 拒绝申请
         self.approval_detail_page.reject_with_comment("申请不符合要求，已拒绝。")
-        self.approval_detail_page.wait_for_approval_processed()
 
         # 验证申请状态已更新
         status = self.approval_detail_page.get_approval_status()
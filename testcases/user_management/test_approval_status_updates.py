@@ -4,7 +4,7 @@ from playwright.sync_api import expect
 from core.base_test import BaseTest
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
-from pages.approval_pages import ApprovalCreatePage, ApprovalListPage, ApprovalDetailPage
+from pages.approval_pages import APPROVED_STATUS, ApprovalCreatePage, ApprovalListPage, ApprovalDetailPage
 
 
 class TestApprovalStatusUpdates(BaseTest):
@@ -92,11 +92,10 @@ class TestApprovalStatusUpdates(BaseTest):
         self.approval_list_page.navigate()
         self.approval_list_page.click_view_approval(0)
         self.approval_detail_page.approve_with_comment("状态更新测试通过")
-        self.approval_detail_page.wait_for_approval_processed()
 
         # 返回列表检查状态更新
         self.approval_detail_page.click_back()
-        self.approval_list_page.wait_for_approval_update()
+        self.approval_list_page.wait_for_approval_update(APPROVED_STATUS)
 
         updated_info = self.approval_list_page.get_approval_info(0)
         updated_status = updated_info["status"]
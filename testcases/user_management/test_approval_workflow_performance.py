@@ -87,7 +87,6 @@ class TestApprovalWorkflowPerformance(BaseTest):
         self.approval_list_page.navigate()
         self.approval_list_page.click_view_approval(0)
         self.approval_detail_page.approve_with_comment("性能测试通过")
-        self.approval_detail_page.wait_for_approval_processed()
 
         end_time = time.time()
         workflow_duration = end_time - start_time
@@ -11,6 +11,7 @@ cmbird 日志代理
 - 使用 ContextVar 持有“当前用例”的 logger（由 BaseTest 在 setUp 时注册）
 - 提供 LoggerProxy：接口与常见 logger 相同（debug/info/warning/error），若无当前 logger 则静默（no-op）
 - 提供 set_current_logger()/clear_current_logger() 助手，供 BaseTest 管理
+- 提供 isEnabledFor()：无当前 logger 或级别被过滤时返回 False，调用方可据此跳过昂贵的消息构建
 """
 
 from contextvars import ContextVar
@@ -33,6 +34,9 @@ class _NoopLogger:
     def error(self, *args, **kwargs):
         pass
 
+    def isEnabledFor(self, level: int) -> bool:
+        return False
+
 
 _noop = _NoopLogger()
 
@@ -58,6 +62,11 @@ class LoggerProxy:
     def _delegate(self):
         return get_current_logger()
 
+    def isEnabledFor(self, level: int) -> bool:
+        """当前 logger 是否会处理该级别的日志；未知实现视为启用。"""
+        check = getattr(self._delegate(), "isEnabledFor", None)
+        return bool(check(level)) if check else True
+
     def debug(self, *args, **kwargs):
         return self._delegate().debug(*args, **kwargs)
 
@@ -5,13 +5,75 @@
 
 当前包含：
 - is_failed(result, class_name, method_name): 基于 unittest TestCase.id() 的失败判断。
-- load_yaml_with_default(config_file, default_provider, logger, context): 通用 YAML 配置加载。
+- load_yaml_with_default(config_file, default_provider, logger, context): 通用 YAML 配置加载
+  （进程内按路径与 mtime 缓存，跨进程通过 `<config>.cache.json` 旁路文件复用解析结果）。
+- flatten_config(data): 将嵌套配置展开为点号键字典，供配置类 O(1) 查询。
+- readonly_view(value, default): 为配置子字典构建只读视图，供访问器零拷贝返回。
 """
 
+import copy
+import json
 import os
 import yaml
 from pathlib import Path
-from typing import Any, Callable, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# 优先使用 libyaml 的 C 实现，未安装时回退纯 Python 实现
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# 旁路缓存优先使用 orjson，未安装时回退标准库 json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 进程级 YAML 解析缓存：(绝对路径, mtime_ns) -> 解析结果
+_YAML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_json_sidecar(sidecar: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """读取 JSON 旁路缓存；缺失、损坏或源文件已变更时返回 None。"""
+    try:
+        with open(sidecar, "rb") as f:
+            payload = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("source_mtime_ns") != mtime_ns:
+        return None
+    return payload.get("data")
+
+
+def _write_json_sidecar(sidecar: str, mtime_ns: int, data: Dict[str, Any]) -> None:
+    """原子写入 JSON 旁路缓存；数据无法被 JSON 无损表示或写入失败时静默跳过。"""
+    tmp = f"{sidecar}.{os.getpid()}.tmp"
+    try:
+        raw = _json_dumps({"source_mtime_ns": mtime_ns, "data": data})
+        if _json_loads(raw)["data"] != data:
+            return
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 
 def is_failed(result: Any, class_name: str, method_name: str) -> bool:
@@ -25,12 +87,9 @@ def is_failed(result: Any, class_name: str, method_name: str) -> bool:
     base_method = method_name.split("__", 1)[0]
     suffix_alt = f"{class_name}.{base_method}"
 
-    try:
-        errors = list(getattr(result, "errors", []))
-        failures = list(getattr(result, "failures", []))
-    except Exception:
-        errors = []
-        failures = []
+    # 直接遍历结果列表，不做拷贝；扫描期间 result 不会被修改
+    errors = getattr(result, "errors", None) or ()
+    failures = getattr(result, "failures", None) or ()
 
     def _match(test_id: str) -> bool:
         return test_id.endswith(suffix) or test_id.endswith(suffix_alt)
@@ -54,6 +113,10 @@ def load_yaml_with_default(
 ) -> Dict[str, Any]:
     """加载 YAML 配置：存在则解析，缺失或异常回退默认，并记录统一日志。
 
+    同一文件在未修改（mtime 不变）时只解析一次，多个配置类共享解析结果；
+    首次解析后写入 `<config>.cache.json`，后续进程在源文件未变更时直接读取 JSON。
+    返回值为缓存的深拷贝，调用方可安全修改。
+
     - config_file: 配置文件路径
     - default_provider: 返回默认配置的回调
     - logger: 日志记录器
@@ -61,10 +124,23 @@ def load_yaml_with_default(
     """
     try:
         if os.path.exists(config_file):
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-            logger.debug(f"{context} 配置文件加载成功: {config_file}")
-            return data
+            path = os.path.abspath(config_file)
+            mtime_ns = os.stat(path).st_mtime_ns
+            key = (path, mtime_ns)
+            data = _YAML_CACHE.get(key)
+            if data is None:
+                sidecar = path + ".cache.json"
+                data = _read_json_sidecar(sidecar, mtime_ns)
+                if data is None:
+                    with open(config_file, "r", encoding="utf-8") as f:
+                        data = yaml.load(f, Loader=YamlLoader) or {}
+                    _write_json_sidecar(sidecar, mtime_ns, data)
+                # 文件已变更：丢弃同一路径的旧缓存
+                for stale in [k for k in _YAML_CACHE if k[0] == path]:
+                    del _YAML_CACHE[stale]
+                _YAML_CACHE[key] = data
+                logger.debug(f"{context} 配置文件加载成功: {config_file}")
+            return copy.deepcopy(data)
         else:
             logger.warning(f"{context} 配置文件不存在: {config_file}，使用默认配置")
             return default_provider()
@@ -73,6 +149,32 @@ def load_yaml_with_default(
         return default_provider()
 
 
+def flatten_config(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """将嵌套配置展开为 {"browser.type": ...} 形式的扁平字典。
+
+    中间层级同样保留（如 "browser"、"browser.viewport" 指向对应子字典），
+    以保持与逐级遍历版本 get() 相同的语义。
+    """
+    flat: Dict[str, Any] = {}
+    if not isinstance(data, dict):
+        return flat
+    # 显式栈迭代展开，单一结果字典，避免逐层递归创建中间字典
+    stack = [(prefix, data)]
+    while stack:
+        base, node = stack.pop()
+        for k, v in node.items():
+            key = f"{base}{k}"
+            flat[key] = v
+            if isinstance(v, dict):
+                stack.append((key + ".", v))
+    return flat
+
+
+def readonly_view(value: Any, default: Mapping[str, Any] = MappingProxyType({})) -> Mapping[str, Any]:
+    """dict 返回其只读视图（零拷贝，随源字典同步），其他值返回 default。"""
+    return MappingProxyType(value) if isinstance(value, dict) else default
+
+
 def default_config_path() -> str:
     """返回项目根目录下的默认配置文件路径 `config.yaml`。
 
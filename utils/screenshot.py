@@ -1,4 +1,5 @@
 import os
+import logging
 import traceback
 from datetime import datetime
 from typing import List
@@ -60,7 +61,8 @@ class ScreenshotHelper:
                     mask = [page.locator(sel) for sel in mask_selectors]
                 except Exception as e:
                     logger.debug(f"构建截图遮挡时出现异常: {e}")
-                    logger.debug(traceback.format_exc())
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(traceback.format_exc())
 
             # 采集截图
             page.screenshot(path=screenshot_path, full_page=full_page, type=image_type, mask=mask or None)
@@ -69,5 +71,6 @@ class ScreenshotHelper:
             return screenshot_path
         except Exception as e:
             logger.debug(f"失败截图采集时出现异常: {e}")
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
             return None
\ No newline at end of file